@@ -12,90 +12,197 @@ Call everything on the class — no instantiation needed.
 External dependencies:
     pysdl2  — pip install pysdl2
     SDL2 shared library must be locatable via PYSDL2_DLL_PATH env var
+    pysdl2 is imported lazily on SDL_Init() / first constant access,
+    so PYSDL2_DLL_PATH only has to be set before that point.
+    Errors go to SDLManager.error_callback(title, message) if set, else
+    stderr — this module does not import tkinter.
 
 Index-based enumeration (SDL2 design):
     SDL_GetJoystickIDs() returns [0, 1, 2 ...] sequential indices.
     These indices are passed directly to all other SDL2 functions.
 """
 
+import ctypes
 import sys
-from tkinter import messagebox
+
+sdl2 = None  # PySDL2 module — bound by _ensure_loaded(), not at import time
+
+def _error_sink(title, message):
+    """Default error reporter: stderr only, so this module never pulls in tkinter."""
+    print(f"{title}: {message}", file=sys.stderr)
+
+def _report_error(title, message):
+    """Route an error to SDLManager.error_callback (set by the UI) or stderr."""
+    (SDLManager.error_callback or _error_sink)(title, message)
 
 # ============================================================================
-# IMPORT SDL2 LIBRARY
+# IMPORT SDL2 LIBRARY  (deferred until first use)
 # ============================================================================
-try:
-    import sdl2
-    import sdl2.ext
-except ImportError:
-    messagebox.showerror("Error", "PySDL2 not installed.\nRun: pip install pysdl2")
-    sys.exit(1)
-except Exception as e:
-    messagebox.showerror("DLL Error", f"Could not find SDL2 Library in:\n Ryujinx Directory\n\nError: {e}")
-    sys.exit(1)
+def _ensure_loaded():
+    """
+    Import PySDL2 (which loads the SDL2 shared library) and bind SDLManager's
+    constants and function aliases. Runs once — from SDL_Init() or from the
+    first constant lookup on SDLManager, whichever comes first.
+    """
+    global sdl2
+    if sdl2 is not None:
+        return
+
+    try:
+        import sdl2
+        import sdl2.ext
+    except ImportError:
+        _report_error("Error", "PySDL2 not installed.\nRun: pip install pysdl2")
+        sys.exit(1)
+    except Exception as e:
+        _report_error("DLL Error", f"Could not find SDL2 Library in:\n Ryujinx Directory\n\nError: {e}")
+        sys.exit(1)
+
+    _prebind(sdl2.SDL_GameControllerGetButton,   [ctypes.c_void_p, ctypes.c_int], ctypes.c_uint8)
+    _prebind(sdl2.SDL_GameControllerGetJoystick, [ctypes.c_void_p])  # Keeps SDL_Joystick* return for GUID calls
+    _prebind(sdl2.SDL_JoystickInstanceID,        [ctypes.c_void_p], ctypes.c_int32)
+    _prebind(sdl2.SDL_IsGameController,          [ctypes.c_int],    ctypes.c_int)
+
+    _bind_members()
+
+# ============================================================================
+# PRE-BIND HOT-PATH SIGNATURES
+# ============================================================================
+def _prebind(fn, argtypes, restype=None):
+    """
+    Pin plain ctypes signatures on a per-frame SDL function.
+    Handles go in as c_void_p (accepts pysdl2 pointer objects and ints alike)
+    and scalar returns skip pysdl2's wrapper types. restype=None keeps pysdl2's.
+    Non-ctypes callables (if pysdl2 ever wraps them) are left untouched.
+    """
+    if not isinstance(fn, ctypes._CFuncPtr):
+        return
+    fn.argtypes = argtypes
+    if restype is not None:
+        fn.restype = restype
+
+def _no_controller_path(ctrl):
+    """SDL_GameControllerPath stand-in for SDL2 < 2.24 (no HID path available)."""
+    return None
+
+# ============================================================================
+# BIND SDLManager MEMBERS
+# ============================================================================
+def _bind_members():
+    """Populate SDLManager's constants, type aliases and SDL function aliases."""
+    members = {
+        # === BUTTON CONSTANTS (integers) ===
+        "SDL_CONTROLLER_BUTTON_A":              sdl2.SDL_CONTROLLER_BUTTON_A,       # Cross / A
+        "SDL_CONTROLLER_BUTTON_B":              sdl2.SDL_CONTROLLER_BUTTON_B,       # Circle / B
+        "SDL_CONTROLLER_BUTTON_X":              sdl2.SDL_CONTROLLER_BUTTON_X,       # Square / X
+        "SDL_CONTROLLER_BUTTON_Y":              sdl2.SDL_CONTROLLER_BUTTON_Y,       # Triangle / Y
+        "SDL_CONTROLLER_BUTTON_START":          sdl2.SDL_CONTROLLER_BUTTON_START,
+        "SDL_CONTROLLER_BUTTON_BACK":           sdl2.SDL_CONTROLLER_BUTTON_BACK,
+        "SDL_CONTROLLER_BUTTON_LEFT_SHOULDER":  sdl2.SDL_CONTROLLER_BUTTON_LEFTSHOULDER,
+        "SDL_CONTROLLER_BUTTON_RIGHT_SHOULDER": sdl2.SDL_CONTROLLER_BUTTON_RIGHTSHOULDER,
+
+        # === EVENT CONSTANTS (integers) ===
+        "SDL_CONTROLLERBUTTONDOWN":             sdl2.SDL_CONTROLLERBUTTONDOWN,
+        "SDL_CONTROLLERBUTTONUP":               sdl2.SDL_CONTROLLERBUTTONUP,
+        "SDL_CONTROLLERDEVICEADDED":            sdl2.SDL_CONTROLLERDEVICEADDED,
+        "SDL_CONTROLLERDEVICEREMOVED":          sdl2.SDL_CONTROLLERDEVICEREMOVED,
+        "SDL_QUIT":                             sdl2.SDL_QUIT,
+
+        # Events that change the joystick index list (invalidate _joystick_ids_cache)
+        "_DEVICE_EVENTS": frozenset((
+            sdl2.SDL_JOYDEVICEADDED,
+            sdl2.SDL_JOYDEVICEREMOVED,
+            sdl2.SDL_CONTROLLERDEVICEADDED,
+            sdl2.SDL_CONTROLLERDEVICEREMOVED,
+            sdl2.SDL_CONTROLLERDEVICEREMAPPED,
+        )),
+
+        # === INIT CONSTANTS (integers) ===
+        "SDL_INIT_GAMECONTROLLER":              sdl2.SDL_INIT_GAMECONTROLLER,
+        "SDL_INIT_JOYSTICK":                    sdl2.SDL_INIT_JOYSTICK,
+
+        # === TYPE ALIASES (class/type) ===
+        "SDL_Event":                            sdl2.SDL_Event,
+
+        # === SCRATCH BUFFERS ===
+        "_event_buffer":                        (sdl2.SDL_Event * 32)(),
+    }
+
+    # === BUTTON MASKS (bit N set = button N held — see read_button_bitmask) ===
+    back  = members["SDL_CONTROLLER_BUTTON_BACK"]
+    left  = members["SDL_CONTROLLER_BUTTON_LEFT_SHOULDER"]
+    right = members["SDL_CONTROLLER_BUTTON_RIGHT_SHOULDER"]
+    members["KILL_BUTTONS"]    = (back, left, right)
+    members["KILL_MASK"]       = (1 << back) | (1 << left) | (1 << right)
+
+    # SDL_GameControllerPath was added in SDL 2.24 — decide once against the
+    # loaded library instead of catching a missing-function error per call
+    ver = sdl2.SDL_version()
+    sdl2.SDL_GetVersion(ctypes.byref(ver))
+    has_path = (ver.major, ver.minor) >= (2, 24)
+
+    # === SDL FUNCTION ALIASES (explicit staticmethods — no self injection,
+    #     even if pysdl2 ever hands back a plain Python function) ===
+    aliases = {
+        "SDL_IsGameController":                 sdl2.SDL_IsGameController,
+        "SDL_GameControllerOpen":               sdl2.SDL_GameControllerOpen,
+        "SDL_GameControllerClose":              sdl2.SDL_GameControllerClose,
+        "SDL_GameControllerName":               sdl2.SDL_GameControllerName,
+        "SDL_GameControllerGetJoystick":        sdl2.SDL_GameControllerGetJoystick,
+        "SDL_GameControllerGetButton":          sdl2.SDL_GameControllerGetButton,
+        "SDL_GameControllerPath":               sdl2.SDL_GameControllerPath if has_path else _no_controller_path,
+        "SDL_JoystickInstanceID":               sdl2.SDL_JoystickInstanceID,
+        "SDL_JoystickGetPlayerIndex":           sdl2.SDL_JoystickGetPlayerIndex,
+        "SDL_JoystickGetGUID":                  sdl2.SDL_JoystickGetGUID,
+        "SDL_JoystickGetGUIDString":            sdl2.SDL_JoystickGetGUIDString,
+        "SDL_PollEvent":                        sdl2.SDL_PollEvent,
+        "SDL_QuitSubSystem":                    sdl2.SDL_QuitSubSystem,
+        "SDL_GetError":                         sdl2.SDL_GetError,
+        "SDL_Quit":                             sdl2.SDL_Quit,
+    }
+    members.update((name, staticmethod(fn)) for name, fn in aliases.items())
+
+    for name, value in members.items():
+        setattr(SDLManager, name, value)
 
 
 # ============================================================================
 # SDLManager CLASS
 # ============================================================================
 
-class SDLManager:
+class _LazySDL2(type):
+    """Metaclass: the first lookup of a not-yet-bound member loads SDL2."""
+
+    def __getattr__(cls, name):
+        if sdl2 is None and not name.startswith("__"):
+            _ensure_loaded()
+            return getattr(cls, name)
+        raise AttributeError(f"type object '{cls.__name__}' has no attribute '{name}'")
+
+class SDLManager(metaclass=_LazySDL2):
     """
     Staticmethod wrapper over SDL2.
 
-    Three kinds of members:
+    Four kinds of members:
         - Plain class attribute : integer constants and type aliases (no self risk)
-        - sdl2.fn : direct SDL2 function aliases (blocks self injection)
+        - staticmethod(sdl2.fn) : direct SDL2 function aliases (no self injection)
         - @staticmethod def     : custom logic wrapping SDL2 calls
-    """
+        - _underscore attribute : private scratch buffers/state reused across calls
 
-    # =========================================================================
-    # BUTTON CONSTANTS  (integers — plain class attribute)
-    # =========================================================================
-    SDL_CONTROLLER_BUTTON_A                 = sdl2.SDL_CONTROLLER_BUTTON_A      # Cross / A
-    SDL_CONTROLLER_BUTTON_B                 = sdl2.SDL_CONTROLLER_BUTTON_B      # Circle / B
-    SDL_CONTROLLER_BUTTON_X                 = sdl2.SDL_CONTROLLER_BUTTON_X      # Square / X
-    SDL_CONTROLLER_BUTTON_Y                 = sdl2.SDL_CONTROLLER_BUTTON_Y      # Triangle / Y
-    SDL_CONTROLLER_BUTTON_START             = sdl2.SDL_CONTROLLER_BUTTON_START
-    SDL_CONTROLLER_BUTTON_BACK              = sdl2.SDL_CONTROLLER_BUTTON_BACK
-    SDL_CONTROLLER_BUTTON_LEFT_SHOULDER     = sdl2.SDL_CONTROLLER_BUTTON_LEFTSHOULDER
-    SDL_CONTROLLER_BUTTON_RIGHT_SHOULDER    = sdl2.SDL_CONTROLLER_BUTTON_RIGHTSHOULDER
-
-    # =========================================================================
-    # EVENT CONSTANTS  (integers — plain class attribute)
-    # =========================================================================
-    SDL_CONTROLLERBUTTONDOWN        = sdl2.SDL_CONTROLLERBUTTONDOWN
-    SDL_QUIT                        = sdl2.SDL_QUIT
-
-    # =========================================================================
-    # INIT CONSTANTS  (integers — plain class attribute)
-    # =========================================================================
-    SDL_INIT_GAMECONTROLLER         = sdl2.SDL_INIT_GAMECONTROLLER
-    SDL_INIT_JOYSTICK               = sdl2.SDL_INIT_JOYSTICK
+    Constants and aliases are bound on first use (see _bind_members), so
+    importing this module does not load SDL2. Call SDL_Init() first.
+    """
 
     # =========================================================================
-    # TYPE ALIASES  (class/type — plain class attribute)
+    # SCRATCH STATE  (_event_buffer is allocated by _bind_members)
     # =========================================================================
-    SDL_Event                       = sdl2.SDL_Event
+    _joystick_ids_cache             = None          # Last SDL_GetJoystickIDs() result
+    _cache_dirty                    = True          # Set on hot-plug / re-init
 
     # =========================================================================
-    # SDL FUNCTION ALIASES  (staticmethod — blocks self injection)
+    # ERROR REPORTING  (UI layer installs e.g. messagebox.showerror here)
     # =========================================================================
-    SDL_IsGameController            = sdl2.SDL_IsGameController
-    SDL_GameControllerOpen          = sdl2.SDL_GameControllerOpen
-    SDL_GameControllerClose         = sdl2.SDL_GameControllerClose
-    SDL_GameControllerName          = sdl2.SDL_GameControllerName
-    SDL_GameControllerGetJoystick   = sdl2.SDL_GameControllerGetJoystick
-    SDL_GameControllerGetButton     = sdl2.SDL_GameControllerGetButton
-    SDL_GameControllerPath          = sdl2.SDL_GameControllerPath
-    SDL_JoystickInstanceID          = sdl2.SDL_JoystickInstanceID
-    SDL_JoystickGetPlayerIndex      = sdl2.SDL_JoystickGetPlayerIndex
-    SDL_JoystickGetGUID             = sdl2.SDL_JoystickGetGUID
-    SDL_JoystickGetGUIDString       = sdl2.SDL_JoystickGetGUIDString
-    SDL_PollEvent                   = sdl2.SDL_PollEvent
-    SDL_QuitSubSystem               = sdl2.SDL_QuitSubSystem
-    SDL_GetError                    = sdl2.SDL_GetError
-    SDL_Quit                        = sdl2.SDL_Quit
+    error_callback                  = None          # callable(title, message) or None → stderr
 
     # =========================================================================
     # CUSTOM WRAPPERS  (@staticmethod def — extra logic on top of SDL2)
@@ -103,15 +210,17 @@ class SDLManager:
     @staticmethod
     def SDL_Init(flags=None):
         """
-        Initialize SDL2 subsystems.
+        Initialize SDL2 subsystems (loads PySDL2 on first call).
         SDL2: returns 0 on success, negative on failure.
         """
+        _ensure_loaded()
         if flags is None:
             flags = sdl2.SDL_INIT_JOYSTICK | sdl2.SDL_INIT_GAMECONTROLLER
         ret = sdl2.SDL_Init(flags)
+        SDLManager._cache_dirty = True  # Indices are reassigned on (re)init
         if ret != 0:
             err = sdl2.SDL_GetError()
-            messagebox.showerror("Driver Error", f"Failed to initialize SDL2.\n{err}")
+            _report_error("Driver Error", f"Failed to initialize SDL2.\n{err}")
 
     @staticmethod
     def SDL_NumJoysticks():
@@ -124,10 +233,75 @@ class SDLManager:
         Return sequential indices [0, 1, 2 ...] to match SDL3's ID-based interface.
         SDL2 uses integer indices directly as device handles, so index == ID here.
 
+        The list is cached and only rebuilt after a device event drained by
+        SDL_DrainEvents (or an SDL_Init). Callers must not mutate it.
+
         Returns:
             list[int]: Sequential joystick indices (may be empty)
         """
-        return list(range(sdl2.SDL_NumJoysticks()))
+        if SDLManager._cache_dirty or SDLManager._joystick_ids_cache is None:
+            SDLManager._joystick_ids_cache = list(range(sdl2.SDL_NumJoysticks()))
+            SDLManager._cache_dirty = False
+        return SDLManager._joystick_ids_cache
+
+    @staticmethod
+    def SDL_DrainEvents(max_batch=32):
+        """
+        Pump the OS event queue once and pull every pending event in batches.
+
+        Replaces calling SDL_PollEvent in a loop — each SDL_PollEvent call
+        re-pumps the OS queue and re-takes SDL's event mutex.
+
+        Args:
+            max_batch (int): Events fetched per SDL_PeepEvents call.
+
+        Returns:
+            list[SDL_Event]: Copies of the drained events (may be empty)
+        """
+        buf = SDLManager._event_buffer
+        if len(buf) < max_batch:
+            buf = SDLManager._event_buffer = (sdl2.SDL_Event * max_batch)()
+
+        sdl2.SDL_PumpEvents()
+        events = []
+        while True:
+            n = sdl2.SDL_PeepEvents(buf, max_batch, sdl2.SDL_GETEVENT,
+                                    sdl2.SDL_FIRSTEVENT, sdl2.SDL_LASTEVENT)
+            if n <= 0:
+                break
+            for i in range(n):
+                # Copy out — the buffer is overwritten by the next batch/poll
+                event = sdl2.SDL_Event.from_buffer_copy(buf[i])
+                if event.type in SDLManager._DEVICE_EVENTS:
+                    SDLManager._cache_dirty = True
+                events.append(event)
+            if n < max_batch:
+                break
+        return events
+
+    @staticmethod
+    def read_button_bitmask(pad, buttons):
+        """
+        Pack the held state of several buttons into one integer.
+
+        Args:
+            pad:     Open game controller handle
+            buttons: Button IDs to read (e.g. KILL_BUTTONS)
+
+        Returns:
+            int: Bit (1 << button) set for every held button
+        """
+        get_button = SDLManager.SDL_GameControllerGetButton
+        mask = 0
+        for button in buttons:
+            if get_button(pad, button):
+                mask |= 1 << button
+        return mask
+
+    @staticmethod
+    def get_device_info(event):
+        """Returns which from a controller device event (ADDED: device index, REMOVED: instance ID)."""
+        return event.cdevice.which
 
     @staticmethod
     def get_button_info(event):
@@ -12,6 +12,10 @@ Call everything on the class — no instantiation needed.
 External dependencies:
     pysdl3  — pip install pysdl3
     SDL3 shared library must be locatable via PYSDL3_DLL_PATH env var
+    pysdl3 is imported lazily on SDL_Init() / first constant access,
+    so the SDL_* loader env vars only have to be set before that point.
+    Errors go to SDLManager.error_callback(title, message) if set, else
+    stderr — this module does not import tkinter.
 
 ID-based enumeration (SDL3 design):
     SDL_GetJoystickIDs() returns opaque uint32 IDs from SDL_GetJoysticks().
@@ -27,82 +31,175 @@ SDL3 key differences vs SDL2:
 
 import ctypes
 import sys
-from tkinter import messagebox
+
+sdl3 = None  # PySDL3 module — bound by _ensure_loaded(), not at import time
+
+def _error_sink(title, message):
+    """Default error reporter: stderr only, so this module never pulls in tkinter."""
+    print(f"{title}: {message}", file=sys.stderr)
+
+def _report_error(title, message):
+    """Route an error to SDLManager.error_callback (set by the UI) or stderr."""
+    (SDLManager.error_callback or _error_sink)(title, message)
 
 # ============================================================================
-# IMPORT SDL3 LIBRARY
+# IMPORT SDL3 LIBRARY  (deferred until first use)
 # ============================================================================
-try:
-    import sdl3
-except ImportError:
-    messagebox.showerror("Error", "PySDL3 not installed.\nRun: pip install pysdl3")
-    sys.exit(1)
-except Exception as e:
-    messagebox.showerror("DLL Error", f"Could not find SDL3 Library in:\nRyujinx Directory\n\nError: {e}")
-    sys.exit(1)
+def _ensure_loaded():
+    """
+    Import PySDL3 (which loads the SDL3 shared library) and bind SDLManager's
+    constants and function aliases. Runs once — from SDL_Init() or from the
+    first constant lookup on SDLManager, whichever comes first.
+    """
+    global sdl3
+    if sdl3 is not None:
+        return
+
+    try:
+        import sdl3
+    except ImportError:
+        _report_error("Error", "PySDL3 not installed.\nRun: pip install pysdl3")
+        sys.exit(1)
+    except Exception as e:
+        _report_error("DLL Error", f"Could not find SDL3 Library in:\nRyujinx Directory\n\nError: {e}")
+        sys.exit(1)
+
+    _prebind(sdl3.SDL_GetGamepadButton,        [ctypes.c_void_p, ctypes.c_int], ctypes.c_bool)
+    _prebind(sdl3.SDL_GetGamepadJoystick,      [ctypes.c_void_p])  # Keeps SDL_Joystick* return for GUID calls
+    _prebind(sdl3.SDL_GetJoystickID,           [ctypes.c_void_p], ctypes.c_uint32)
+    _prebind(sdl3.SDL_IsGamepad,               [ctypes.c_uint32], ctypes.c_bool)
+
+    _bind_members()
+
+# ============================================================================
+# PRE-BIND HOT-PATH SIGNATURES
+# ============================================================================
+def _prebind(fn, argtypes, restype=None):
+    """
+    Pin plain ctypes signatures on a per-frame SDL function.
+    Handles go in as c_void_p (accepts pysdl3 pointer objects and ints alike)
+    and scalar returns skip pysdl3's wrapper types. restype=None keeps pysdl3's.
+    Non-ctypes callables (if pysdl3 wraps them) are left untouched.
+    """
+    if not isinstance(fn, ctypes._CFuncPtr):
+        return
+    fn.argtypes = argtypes
+    if restype is not None:
+        fn.restype = restype
+
+# ============================================================================
+# BIND SDLManager MEMBERS
+# ============================================================================
+def _bind_members():
+    """Populate SDLManager's constants, type aliases and SDL function aliases."""
+    members = {
+        # === BUTTON CONSTANTS (integers) ===
+        "SDL_CONTROLLER_BUTTON_A":              sdl3.SDL_GAMEPAD_BUTTON_SOUTH,      # Cross / A
+        "SDL_CONTROLLER_BUTTON_B":              sdl3.SDL_GAMEPAD_BUTTON_EAST,       # Circle / B
+        "SDL_CONTROLLER_BUTTON_X":              sdl3.SDL_GAMEPAD_BUTTON_WEST,       # Square / X
+        "SDL_CONTROLLER_BUTTON_Y":              sdl3.SDL_GAMEPAD_BUTTON_NORTH,      # Triangle / Y
+        "SDL_CONTROLLER_BUTTON_START":          sdl3.SDL_GAMEPAD_BUTTON_START,
+        "SDL_CONTROLLER_BUTTON_BACK":           sdl3.SDL_GAMEPAD_BUTTON_BACK,
+        "SDL_CONTROLLER_BUTTON_LEFT_SHOULDER":  sdl3.SDL_GAMEPAD_BUTTON_LEFT_SHOULDER,
+        "SDL_CONTROLLER_BUTTON_RIGHT_SHOULDER": sdl3.SDL_GAMEPAD_BUTTON_RIGHT_SHOULDER,
+
+        # === EVENT CONSTANTS (integers) ===
+        "SDL_CONTROLLERBUTTONDOWN":             sdl3.SDL_EVENT_GAMEPAD_BUTTON_DOWN,
+        "SDL_CONTROLLERBUTTONUP":               sdl3.SDL_EVENT_GAMEPAD_BUTTON_UP,
+        "SDL_CONTROLLERDEVICEADDED":            sdl3.SDL_EVENT_GAMEPAD_ADDED,
+        "SDL_CONTROLLERDEVICEREMOVED":          sdl3.SDL_EVENT_GAMEPAD_REMOVED,
+        "SDL_QUIT":                             sdl3.SDL_EVENT_QUIT,
+
+        # Events that change the joystick ID list (invalidate _joystick_ids_cache)
+        "_DEVICE_EVENTS": frozenset((
+            sdl3.SDL_EVENT_JOYSTICK_ADDED,
+            sdl3.SDL_EVENT_JOYSTICK_REMOVED,
+            sdl3.SDL_EVENT_GAMEPAD_ADDED,
+            sdl3.SDL_EVENT_GAMEPAD_REMOVED,
+            sdl3.SDL_EVENT_GAMEPAD_REMAPPED,
+        )),
+
+        # === INIT CONSTANTS (integers) ===
+        # SDL_INIT_GAMECONTROLLER renamed to SDL_INIT_GAMEPAD in SDL3
+        "SDL_INIT_GAMECONTROLLER":              sdl3.SDL_INIT_GAMEPAD,
+        "SDL_INIT_JOYSTICK":                    sdl3.SDL_INIT_JOYSTICK,
+
+        # === TYPE ALIASES (class/type) ===
+        "SDL_Event":                            sdl3.SDL_Event,
+
+        # === SCRATCH BUFFERS ===
+        "_event_buffer":                        (sdl3.SDL_Event * 32)(),
+    }
+
+    # === BUTTON MASKS (bit N set = button N held — see read_button_bitmask) ===
+    back  = members["SDL_CONTROLLER_BUTTON_BACK"]
+    left  = members["SDL_CONTROLLER_BUTTON_LEFT_SHOULDER"]
+    right = members["SDL_CONTROLLER_BUTTON_RIGHT_SHOULDER"]
+    members["KILL_BUTTONS"]    = (back, left, right)
+    members["KILL_MASK"]       = (1 << back) | (1 << left) | (1 << right)
+
+    # === SDL FUNCTION ALIASES (explicit staticmethods — no self injection,
+    #     even if pysdl3 ever hands back a plain Python function) ===
+    aliases = {
+        "SDL_IsGameController":                 sdl3.SDL_IsGamepad,
+        "SDL_GameControllerOpen":               sdl3.SDL_OpenGamepad,
+        "SDL_GameControllerClose":              sdl3.SDL_CloseGamepad,
+        "SDL_GameControllerName":               sdl3.SDL_GetGamepadName,
+        "SDL_GameControllerGetJoystick":        sdl3.SDL_GetGamepadJoystick,
+        "SDL_GameControllerGetButton":          sdl3.SDL_GetGamepadButton,
+        "SDL_GameControllerPath":               sdl3.SDL_GetGamepadPath,
+        "SDL_JoystickInstanceID":               sdl3.SDL_GetJoystickID,
+        "SDL_JoystickGetPlayerIndex":           sdl3.SDL_GetJoystickPlayerIndex,
+        "SDL_JoystickGetGUID":                  sdl3.SDL_GetJoystickGUID,
+        "SDL_PollEvent":                        sdl3.SDL_PollEvent,
+        "SDL_QuitSubSystem":                    sdl3.SDL_QuitSubSystem,
+        "SDL_GetError":                         sdl3.SDL_GetError,
+        "SDL_Quit":                             sdl3.SDL_Quit,
+    }
+    members.update((name, staticmethod(fn)) for name, fn in aliases.items())
+
+    for name, value in members.items():
+        setattr(SDLManager, name, value)
 
 
 # ============================================================================
 # SDLManager CLASS
 # ============================================================================
 
-class SDLManager:
+class _LazySDL3(type):
+    """Metaclass: the first lookup of a not-yet-bound member loads SDL3."""
+
+    def __getattr__(cls, name):
+        if sdl3 is None and not name.startswith("__"):
+            _ensure_loaded()
+            return getattr(cls, name)
+        raise AttributeError(f"type object '{cls.__name__}' has no attribute '{name}'")
+
+class SDLManager(metaclass=_LazySDL3):
     """
     Staticmethod wrapper over SDL3.
 
-    Three kinds of members:
+    Four kinds of members:
         - Plain class attribute : integer constants and type aliases (no self risk)
-        - sdl3.fn : direct SDL3 function aliases (blocks self injection)
+        - staticmethod(sdl3.fn) : direct SDL3 function aliases (no self injection)
         - @staticmethod def     : custom logic wrapping SDL3 calls
-    """
+        - _underscore attribute : private scratch buffers/state reused across calls
 
-    # =========================================================================
-    # BUTTON CONSTANTS  (integers — plain class attribute)
-    # =========================================================================
-    SDL_CONTROLLER_BUTTON_A              = sdl3.SDL_GAMEPAD_BUTTON_SOUTH          # Cross / A
-    SDL_CONTROLLER_BUTTON_B              = sdl3.SDL_GAMEPAD_BUTTON_EAST           # Circle / B
-    SDL_CONTROLLER_BUTTON_X              = sdl3.SDL_GAMEPAD_BUTTON_WEST           # Square / X
-    SDL_CONTROLLER_BUTTON_Y              = sdl3.SDL_GAMEPAD_BUTTON_NORTH          # Triangle / Y
-    SDL_CONTROLLER_BUTTON_START          = sdl3.SDL_GAMEPAD_BUTTON_START
-    SDL_CONTROLLER_BUTTON_BACK           = sdl3.SDL_GAMEPAD_BUTTON_BACK
-    SDL_CONTROLLER_BUTTON_LEFT_SHOULDER  = sdl3.SDL_GAMEPAD_BUTTON_LEFT_SHOULDER
-    SDL_CONTROLLER_BUTTON_RIGHT_SHOULDER = sdl3.SDL_GAMEPAD_BUTTON_RIGHT_SHOULDER
-
-    # =========================================================================
-    # EVENT CONSTANTS  (integers — plain class attribute)
-    # =========================================================================
-    SDL_CONTROLLERBUTTONDOWN        = sdl3.SDL_EVENT_GAMEPAD_BUTTON_DOWN
-    SDL_QUIT                        = sdl3.SDL_EVENT_QUIT
-
-    # =========================================================================
-    # INIT CONSTANTS  (integers — plain class attribute)
-    # SDL_INIT_GAMECONTROLLER renamed to SDL_INIT_GAMEPAD in SDL3
-    # =========================================================================
-    SDL_INIT_GAMECONTROLLER         = sdl3.SDL_INIT_GAMEPAD
-    SDL_INIT_JOYSTICK               = sdl3.SDL_INIT_JOYSTICK
+    Constants and aliases are bound on first use (see _bind_members), so
+    importing this module does not load SDL3. Call SDL_Init() first.
+    """
 
     # =========================================================================
-    # TYPE ALIASES  (class/type — plain class attribute)
+    # SCRATCH STATE  (_event_buffer is allocated by _bind_members)
     # =========================================================================
-    SDL_Event                       = sdl3.SDL_Event
+    _joystick_ids_cache             = None          # Last SDL_GetJoystickIDs() result
+    _cache_dirty                    = True          # Set on hot-plug / re-init
+    _count_scratch                  = ctypes.c_int(0)  # Out-param for SDL_GetJoysticks (main thread only)
 
     # =========================================================================
-    # SDL FUNCTION ALIASES  (staticmethod — blocks self injection)
+    # ERROR REPORTING  (UI layer installs e.g. messagebox.showerror here)
     # =========================================================================
-    SDL_IsGameController            = sdl3.SDL_IsGamepad
-    SDL_GameControllerOpen          = sdl3.SDL_OpenGamepad
-    SDL_GameControllerClose         = sdl3.SDL_CloseGamepad
-    SDL_GameControllerName          = sdl3.SDL_GetGamepadName
-    SDL_GameControllerGetJoystick   = sdl3.SDL_GetGamepadJoystick
-    SDL_GameControllerGetButton     = sdl3.SDL_GetGamepadButton
-    SDL_GameControllerPath          = sdl3.SDL_GetGamepadPath
-    SDL_JoystickInstanceID          = sdl3.SDL_GetJoystickID
-    SDL_JoystickGetPlayerIndex      = sdl3.SDL_GetJoystickPlayerIndex
-    SDL_JoystickGetGUID             = sdl3.SDL_GetJoystickGUID
-    SDL_PollEvent                   = sdl3.SDL_PollEvent
-    SDL_QuitSubSystem               = sdl3.SDL_QuitSubSystem
-    SDL_GetError                    = sdl3.SDL_GetError
-    SDL_Quit                        = sdl3.SDL_Quit
+    error_callback                  = None          # callable(title, message) or None → stderr
 
     # =========================================================================
     # CUSTOM WRAPPERS  (@staticmethod def — extra logic on top of SDL3)
@@ -110,15 +207,17 @@ class SDLManager:
     @staticmethod
     def SDL_Init(flags=None):
         """
-        Initialize SDL3 subsystems.
+        Initialize SDL3 subsystems (loads PySDL3 on first call).
         SDL3: returns True on success, False on failure (opposite of SDL2).
         """
+        _ensure_loaded()
         if flags is None:
             flags = sdl3.SDL_INIT_GAMEPAD | sdl3.SDL_INIT_JOYSTICK
         ret = sdl3.SDL_Init(flags)
+        SDLManager._cache_dirty = True  # IDs are reassigned on (re)init
         if not ret:  # SDL3: False = failure
             err = sdl3.SDL_GetError()
-            messagebox.showerror("Driver Error", f"Failed to initialize SDL3.\n{err}")
+            _report_error("Driver Error", f"Failed to initialize SDL3.\n{err}")
 
     @staticmethod
     def SDL_GetJoystickIDs():
@@ -128,21 +227,36 @@ class SDLManager:
         SDL3 is ID-based — these are opaque uint32 values, NOT sequential indices.
         Always iterate over this list; never use range(count) as SDL2 substitutes.
 
+        The list is cached and only rebuilt after a device event drained by
+        SDL_DrainEvents (or an SDL_Init). Callers must not mutate it.
+
         Returns:
             list[int]: Joystick instance IDs (may be empty)
         """
-        count = ctypes.c_int(0)
+        if not SDLManager._cache_dirty and SDLManager._joystick_ids_cache is not None:
+            return SDLManager._joystick_ids_cache
+
+        count = SDLManager._count_scratch
+        count.value = 0
         ids_ptr = sdl3.SDL_GetJoysticks(ctypes.byref(count))
-        if not ids_ptr or count.value == 0:
-            return []
-        return list(ids_ptr[:count.value])
+        if not ids_ptr:
+            ids = []
+        else:
+            # View the array as a fixed-size c_uint32 block so list() copies it
+            # in one C-level pass instead of indexing the pointer per element.
+            n = count.value
+            block = ctypes.cast(ids_ptr, ctypes.POINTER(ctypes.c_uint32 * n)).contents
+            ids = list(block)
+            sdl3.SDL_free(ids_ptr)  # SDL3 hands ownership of the array to the caller
+
+        SDLManager._joystick_ids_cache = ids
+        SDLManager._cache_dirty = False
+        return ids
 
     @staticmethod
     def SDL_NumJoysticks():
         """Return the count of currently connected joysticks."""
-        count = ctypes.c_int(0)
-        sdl3.SDL_GetJoysticks(ctypes.byref(count))
-        return count.value
+        return len(SDLManager.SDL_GetJoystickIDs())
 
     @staticmethod
     def SDL_JoystickGetGUIDString(guid, buf, size):
@@ -152,6 +266,66 @@ class SDLManager:
         """
         sdl3.SDL_GUIDToString(guid, buf, size)
 
+    @staticmethod
+    def SDL_DrainEvents(max_batch=32):
+        """
+        Pump the OS event queue once and pull every pending event in batches.
+
+        Replaces calling SDL_PollEvent in a loop — each SDL_PollEvent call
+        re-pumps the OS queue and re-takes SDL's event mutex.
+        SDL3: SDL_PeepEvents returns -1 on error (same as SDL2).
+
+        Args:
+            max_batch (int): Events fetched per SDL_PeepEvents call.
+
+        Returns:
+            list[SDL_Event]: Copies of the drained events (may be empty)
+        """
+        buf = SDLManager._event_buffer
+        if len(buf) < max_batch:
+            buf = SDLManager._event_buffer = (sdl3.SDL_Event * max_batch)()
+
+        sdl3.SDL_PumpEvents()
+        events = []
+        while True:
+            n = sdl3.SDL_PeepEvents(buf, max_batch, sdl3.SDL_GETEVENT,
+                                    sdl3.SDL_EVENT_FIRST, sdl3.SDL_EVENT_LAST)
+            if n <= 0:
+                break
+            for i in range(n):
+                # Copy out — the buffer is overwritten by the next batch/poll
+                event = sdl3.SDL_Event.from_buffer_copy(buf[i])
+                if event.type in SDLManager._DEVICE_EVENTS:
+                    SDLManager._cache_dirty = True
+                events.append(event)
+            if n < max_batch:
+                break
+        return events
+
+    @staticmethod
+    def read_button_bitmask(pad, buttons):
+        """
+        Pack the held state of several buttons into one integer.
+
+        Args:
+            pad:     Open game controller handle
+            buttons: Button IDs to read (e.g. KILL_BUTTONS)
+
+        Returns:
+            int: Bit (1 << button) set for every held button
+        """
+        get_button = SDLManager.SDL_GameControllerGetButton
+        mask = 0
+        for button in buttons:
+            if get_button(pad, button):
+                mask |= 1 << button
+        return mask
+
+    @staticmethod
+    def get_device_info(event):
+        """Returns which from a gamepad device event (joystick ID for both ADDED and REMOVED)."""
+        return event.gdevice.which
+
     @staticmethod
     def get_button_info(event):
         """Returns (button, which) from a gamepad button event."""
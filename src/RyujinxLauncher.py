@@ -30,16 +30,33 @@ import tkinter as tk
 from tkinter import messagebox
 import customtkinter as ctk
 import ctypes
-import copy
 import re
-import time
 import random
-import glob
+from collections import defaultdict, deque
+from functools import cache, lru_cache
+from operator import itemgetter
+from types import MappingProxyType
+
+# Config.json codec: orjson (C) when installed, stdlib json otherwise.
+# Both work on UTF-8 bytes and write 2-space indented, non-ASCII-escaped output.
+try:
+    import orjson
+    json_loads = orjson.loads
+    def json_dumps(obj):
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+except ImportError:
+    json_loads = json.loads
+    def json_dumps(obj):
+        return json.dumps(obj, indent=2, ensure_ascii=False).encode('utf-8')
 
 from DebugLog import log
 from DebugLog import init_log
 
 LAUNCHER_VERSION = "1.1.0"
+UPDATE_INTERVAL_MS = 16  # Main loop tick (~60 Hz)
+IDLE_INTERVAL_MS   = 50  # Backed-off tick once SDL has been quiet for a while (~20 Hz)
+IDLE_AFTER_TICKS   = 60  # Quiet ticks (~1 s) before backing off; any event resets
+PROCESS_POLL_MS    = 250  # Ryujinx exit check while the game runs (~4 Hz)
 
 # ============================================================================
 # SECTION 1: HI-DPI DISPLAY SUPPORT
@@ -111,6 +128,17 @@ UI = {
     'TOAST_POSITION_Y': 0.95,        # Toast Y position (relative)
 }
 
+# Font tuples built once and shared by every widget (CTk applies the scaling)
+FONT = {
+    'TITLE':        (UI['FONT_FAMILY'], UI['FONT_TITLE_SIZE'], "bold"),
+    'CARD':         (UI['FONT_FAMILY'], UI['FONT_CARD_SIZE'], "bold"),
+    'FOOTER':       (UI['FONT_FAMILY'], UI['FONT_FOOTER_SIZE'], "bold"),
+    'ALERT_TITLE':  (UI['FONT_FAMILY'], UI['FONT_ALERT_TITLE_SIZE'], "bold"),
+    'ALERT_TEXT':   (UI['FONT_FAMILY'], UI['FONT_ALERT_TEXT_SIZE']),
+    'ALERT_BTN':    (UI['FONT_FAMILY'], UI['FONT_ALERT_BTN_SIZE'], "bold"),
+    'TOAST':        (UI['FONT_FAMILY'], UI['FONT_TOAST_SIZE'], "bold"),
+}
+
 # ============================================================================
 # SECTION 3: COLOR THEME
 # ============================================================================
@@ -128,12 +156,18 @@ COLOR = {
     'ALERT_YELLOW': '#FFCC00',
 }
 
-COLOR_POOL = [
+COLOR_POOL = (
     "#00FF00", "#00FA9A", "#ADFF2F", "#7FFFD4", "#40E0D0",  # Lime, SpringGreen, GreenYellow, Aqua, Turquoise
     "#00FFFF", "#1E90FF", "#87CEFA", "#4169E1", "#00BFFF",  # Cyan, DodgerBlue, SkyBlue, RoyalBlue, DeepSkyBlue
     "#FF00FF", "#DA70D6", "#9370DB", "#FF69B4", "#D8BFD8",  # Magenta, Orchid, MedPurple, HotPink, Thistle
     "#FFFF00", "#FFD700", "#F0E68C", "#FFC200", "#FFFFFF"   # Yellow, Gold, Khaki, Amber, White
-]
+)
+
+# Empty player slot look — shared by every inactive card refresh. Only the
+# options refresh_grid ever changes; fonts and backgrounds are fixed in build_ui
+INACTIVE_CARD_CFG   = {'border_color': COLOR['BG_CARD']}
+INACTIVE_NUM_CFG    = {'text_color': "#444444"}
+INACTIVE_STATUS_CFG = {'text': "PRESS Ⓐ CONNECT", 'text_color': COLOR['TEXT_DIM']}
 
 # set dark mode once before any window is created
 ctk.set_appearance_mode("dark")
@@ -167,18 +201,18 @@ ryujinx_dir = base_path
 # We look for this file NEXT TO the launcher/script
 path_config_file = os.path.join(base_path, "RyujinxPath.config")
 
-if os.path.exists(path_config_file):
-    try:
-        with open(path_config_file, "r") as f:
-            # clean up quotes and whitespace
-            custom_path = f.readline().strip().replace('"', '')
+# open() doubles as the existence check — a missing file just falls through
+try:
+    with open(path_config_file, "r") as f:
+        # clean up quotes and whitespace
+        custom_path = f.readline().strip().replace('"', '')
 
-            # verify the path actually exists before using it
-            if os.path.exists(custom_path):
-                ryujinx_dir = custom_path
-    except Exception as e:
-        # If reading fails, silently fall back to default (base_path)
-        pass
+        # verify the path actually exists before using it
+        if os.path.exists(custom_path):
+            ryujinx_dir = custom_path
+except Exception as e:
+    # Missing or unreadable: silently fall back to default (base_path)
+    pass
 
 # ============================================================================
 # SECTION 4b: APPIMAGE DETECTION & MOUNT HELPERS (LINUX ONLY)
@@ -189,11 +223,30 @@ if os.path.exists(path_config_file):
 # PR_SET_PDEATHSIG ensures the mount process is killed even on hard crash.
 mount_proc    = None  # Popen handle — terminating it unmounts the squashfs
 
-_appimage_candidates = (
-    glob.glob(os.path.join(ryujinx_dir, "[Rr]yujinx*.AppImage")) or
-    glob.glob(os.path.join(ryujinx_dir, "RYUJINX*.AppImage"))
-)
-appimage_path = _appimage_candidates[0] if _appimage_candidates else None
+# Ryujinx*.AppImage / ryujinx*.AppImage, falling back to RYUJINX*.AppImage
+_APPIMAGE_RE = re.compile(r'([Rr]yujinx|RYUJINX).*\.AppImage', re.DOTALL)
+
+def find_appimage(directory):
+    """
+    Return the Ryujinx AppImage in directory, or None.
+    One directory listing covers both name casings.
+    """
+    try:
+        names = os.listdir(directory)
+    except OSError:
+        return None
+
+    fallback = None
+    for name in names:
+        m = _APPIMAGE_RE.fullmatch(name)
+        if m is None:
+            continue
+        if m.group(1) != "RYUJINX":
+            return os.path.join(directory, name)
+        fallback = fallback or os.path.join(directory, name)
+    return fallback
+
+appimage_path = find_appimage(ryujinx_dir) if sys.platform not in ("win32", "darwin") else None
 is_appimage   = sys.platform not in ("win32", "darwin") and appimage_path is not None
 
 def mount_appimage():
@@ -255,9 +308,17 @@ if sys.platform == "win32":
     portable_config = os.path.join(ryujinx_dir, "portable", "Config.json")
     appdata_config = os.path.join(os.getenv('APPDATA'), "Ryujinx", "Config.json")
 
-    if os.path.exists(portable_config):
+    # One directory listing instead of a stat per candidate (names lowered —
+    # NTFS lookups are case-insensitive, so the old exists() checks were too)
+    try:
+        with os.scandir(ryujinx_dir) as it:
+            ryujinx_entries = {entry.name.lower() for entry in it}
+    except OSError:
+        ryujinx_entries = set()
+
+    if "portable" in ryujinx_entries and os.path.isfile(portable_config):
         CONFIG_FILE = portable_config
-    elif os.path.exists(os.path.join(ryujinx_dir, "Config.json")):
+    elif "config.json" in ryujinx_entries:
         CONFIG_FILE = os.path.join(ryujinx_dir, "Config.json")
     else:
         CONFIG_FILE = appdata_config
@@ -294,42 +355,70 @@ Returns: Ryujinx version string (1.1.1403/1.3.1/1.3.2/1.3.3/or newer)
 3. Linux: Binary scan for embedded version string → [ENV VAR OVERRIDE fallback].
 """
 
+# Windows: PE version resource layout + version.dll entry points (bound once)
+class VS_FIXEDFILEINFO(ctypes.Structure):
+    _fields_ = [
+        ("dwSignature",        ctypes.c_uint32),
+        ("dwStrucVersion",     ctypes.c_uint32),
+        ("dwFileVersionMS",    ctypes.c_uint32),
+        ("dwFileVersionLS",    ctypes.c_uint32),
+        ("dwProductVersionMS", ctypes.c_uint32),
+        ("dwProductVersionLS", ctypes.c_uint32),
+        ("dwFileFlagsMask",    ctypes.c_uint32),
+        ("dwFileFlags",        ctypes.c_uint32),
+        ("dwFileOS",           ctypes.c_uint32),
+        ("dwFileType",         ctypes.c_uint32),
+        ("dwFileSubtype",      ctypes.c_uint32),
+        ("dwFileDateMS",       ctypes.c_uint32),
+        ("dwFileDateLS",       ctypes.c_uint32),
+    ]
+
+if sys.platform == "win32":
+    _GetFileVersionInfoSizeW = ctypes.windll.version.GetFileVersionInfoSizeW
+    _GetFileVersionInfoSizeW.argtypes = [ctypes.c_wchar_p, ctypes.POINTER(ctypes.c_uint32)]
+    _GetFileVersionInfoSizeW.restype  = ctypes.c_uint32
+
+    _GetFileVersionInfoW = ctypes.windll.version.GetFileVersionInfoW
+    _GetFileVersionInfoW.argtypes = [ctypes.c_wchar_p, ctypes.c_uint32, ctypes.c_uint32, ctypes.c_void_p]
+    _GetFileVersionInfoW.restype  = ctypes.c_int
+
+    _VerQueryValueW = ctypes.windll.version.VerQueryValueW
+    _VerQueryValueW.argtypes = [ctypes.c_void_p, ctypes.c_wchar_p,
+                                ctypes.POINTER(ctypes.c_void_p), ctypes.POINTER(ctypes.c_uint)]
+    _VerQueryValueW.restype  = ctypes.c_int
+
+# macOS: leading X.Y.Z of CFBundleLongVersionString (e.g. "1.3.3-e2143d4")
+_MAC_VER_RE = re.compile(r'"?(\d+\.\d+\.\d+)')
+
+# Linux: embedded "Ryujinx/X.Y.Z" string, matched directly on the raw bytes
+_LINUX_VER_RE = re.compile(rb'"Ryujinx/(\d+\.\d+\.\d+)"')
+
 # Default to new version
 ryujinx_version = "1.1.1403"
 exe_path = TARGET_EXE
 
-if os.path.exists(exe_path):
+# Windows reuses the Section 5 directory listing; elsewhere ryujinx_dir may
+# be an AppImage mount or app bundle, so stat the binary directly
+if sys.platform == "win32":
+    exe_found = "ryujinx.exe" in ryujinx_entries
+else:
+    exe_found = os.path.exists(exe_path)
+
+if exe_found:
     try:
         if sys.platform == "win32":
             # --- WINDOWS METHOD (ctypes) ---
-            ver_info_size = ctypes.windll.version.GetFileVersionInfoSizeW(exe_path, None)
+            ver_info_size = _GetFileVersionInfoSizeW(exe_path, None)
             if ver_info_size:
                 ver_info = ctypes.create_string_buffer(ver_info_size)
-                ctypes.windll.version.GetFileVersionInfoW(exe_path, 0, ver_info_size, ver_info)
+                _GetFileVersionInfoW(exe_path, 0, ver_info_size, ver_info)
 
                 lp_buffer = ctypes.c_void_p()
                 lp_len = ctypes.c_uint()
-                ctypes.windll.version.VerQueryValueW(
+                _VerQueryValueW(
                     ver_info, "\\", ctypes.byref(lp_buffer), ctypes.byref(lp_len)
                 )
 
-                class VS_FIXEDFILEINFO(ctypes.Structure):
-                    _fields_ = [
-                        ("dwSignature",        ctypes.c_uint32),
-                        ("dwStrucVersion",     ctypes.c_uint32),
-                        ("dwFileVersionMS",    ctypes.c_uint32),
-                        ("dwFileVersionLS",    ctypes.c_uint32),
-                        ("dwProductVersionMS", ctypes.c_uint32),
-                        ("dwProductVersionLS", ctypes.c_uint32),
-                        ("dwFileFlagsMask",    ctypes.c_uint32),
-                        ("dwFileFlags",        ctypes.c_uint32),
-                        ("dwFileOS",           ctypes.c_uint32),
-                        ("dwFileType",         ctypes.c_uint32),
-                        ("dwFileSubtype",      ctypes.c_uint32),
-                        ("dwFileDateMS",       ctypes.c_uint32),
-                        ("dwFileDateLS",       ctypes.c_uint32),
-                    ]
-
                 ffi = VS_FIXEDFILEINFO.from_address(lp_buffer.value)
                 v1 = (ffi.dwFileVersionMS >> 16) & 0xFFFF
                 v2 = (ffi.dwFileVersionMS >>  0) & 0xFFFF
@@ -341,11 +430,17 @@ if os.path.exists(exe_path):
             # --- MAC METHOD (Native Plist) ---
             import plistlib
             plist_path = os.path.abspath(os.path.join(exe_path, "..", "..", "Info.plist"))
-            if os.path.exists(plist_path):
+            try:  # open() doubles as the existence check
                 with open(plist_path, 'rb') as f:
-                    raw = plistlib.load(f).get("CFBundleLongVersionString", ryujinx_version)
-                    ryujinx_version = raw.split("-")[0].strip('"')  # "1.3.3-e2143d4" → "1.3.3"
-                    log("INFO", "Ryujinx version detected (macOS plist)", ryujinx_version)
+                    plist = plistlib.load(f)
+            except FileNotFoundError:
+                plist = None
+
+            if plist is not None:
+                raw = plist.get("CFBundleLongVersionString", ryujinx_version)
+                m = _MAC_VER_RE.match(raw)  # "1.3.3-e2143d4" → "1.3.3"
+                ryujinx_version = m.group(1) if m else ryujinx_version
+                log("INFO", "Ryujinx version detected (macOS plist)", ryujinx_version)
             else:
                 # Ideally this should never happen because Ryujinx embeds the version string in all official builds, but we add this as a fallback just in case
                 # Check for environment variable override before giving up
@@ -369,24 +464,21 @@ if os.path.exists(exe_path):
             # --- LINUX METHOD (Binary Scan) ---
             # Mimics: strings Ryujinx | grep 'Ryujinx/' | grep ':' | head -1 | cut -d '"' -f2 | cut -d '/' -f2
 
-            # Step 1: Read binary and decode to ASCII (strips all null bytes and non-printable chars)
+            # Step 1: Map the binary instead of reading + decoding the whole file
+            import mmap
             with open(exe_path, 'rb') as f:
-                data = f.read()
-            text = data.decode('ascii', errors='ignore')
-
-            # Step 2: Scan line by line for the embedded version string
-            # Looking for a line containing: "Ryujinx/1.3.3:..."
-            found_version = None
-            for line in text.splitlines():
-                if '"Ryujinx/' in line and ':' in line:
-                    # cut -d '"' -f2 → take part inside quotes
-                    # cut -d '/' -f2 → take part after the slash
-                    candidate = line.split('"')[1].split('/')[1].strip()
-
-                    # Validate format is X.X.X before accepting (e.g. 1.3.3)
-                    if re.match(r'^\d+\.\d+\.\d+$', candidate):
-                        found_version = candidate
-                        break
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data:
+
+                    # Step 2: Scan for the embedded version string, e.g. "Ryujinx/1.3.3": ...
+                    # The compiled pattern validates the X.X.X format; stop at the first
+                    # hit whose line also contains ':' (same filter as the grep above).
+                    found_version = None
+                    for m in _LINUX_VER_RE.finditer(data):
+                        line_start = data.rfind(b'\n', 0, m.start()) + 1
+                        line_end = data.find(b'\n', m.end())
+                        if data.find(b':', line_start, line_end if line_end != -1 else len(data)) != -1:
+                            found_version = m.group(1).decode('ascii')
+                            break
 
             # Step 3: Apply result or fall back to env var override
             if found_version:
@@ -437,32 +529,63 @@ if sys.platform not in ("win32", "darwin") and os.path.exists(os.path.join(ryuji
 # SECTION 7b: CREATE ENVIRONMENT FOR RYUJINXLAUNCHER AND RYUJINX
 # ============================================================================
 
+# Ryujinx inherits this process's environment directly (Popen env=None).
+# The PySDL loader variables set in Section 8 are not SDL hints, so they
+# have no effect on the emulator's own SDL.
 if ryujinx_version == "1.1.1403":
     os.environ["SDL_JOYSTICK_RAWINPUT"] = "0"
 
-ryujinx_env = os.environ.copy()
-
 # ============================================================================
 # SECTION 8: IMPORT SDL LIBRARY
 # ============================================================================
 
-if tuple(map(int, re.findall(r'\d+', ryujinx_version))) <= tuple(map(int, re.findall(r'\d+', "1.3.205"))):
-    log("INFO", "SDL backend", "SDL2")
-    log("INFO", "SDL2 path", ryujinx_dir)
-    os.environ["PYSDL2_DLL_PATH"] = ryujinx_dir
-    from ControllerManagerSDL2 import SDLManager
-    backend_string="GamepadSDL2"
-else:
-    log("INFO", "SDL backend", "SDL3")
-    log("INFO", "SDL3 path", ryujinx_dir)
-    os.environ["SDL_BINARY_PATH"] = ryujinx_dir
-    os.environ["SDL_DOWNLOAD_BINARIES"] = "0" # Disable SDL Lib Download, "1" by default.
-    os.environ["SDL_DISABLE_METADATA"] = "1" # Disable metadata method, "0" by default.
-    os.environ["SDL_CHECK_BINARY_VERSION"] = "0" # Disable binary version checking, "1" by default.
-    os.environ["SDL_IGNORE_MISSING_FUNCTIONS"] = "1" # Disable missing function warnings, "1" by default.
-    os.environ["SDL_FIND_BINARIES"] = "1" # Search for binaries in the system libraries, "1" by default.
-    from ControllerManagerSDL3 import SDLManager
-    backend_string="GamepadSDL3"
+_SDL3_CUTOFF = (1, 3, 205)  # Last Ryujinx release still bundling SDL2
+
+_VER_RE = re.compile(r'\s*[vV]?(?P<major>\d+)(?:\.(?P<minor>\d+))?(?:\.(?P<patch>\d+))?')
+
+def version_tuple(version):
+    """
+    "1.3.3" / "v1.3.3" / "1.3.3-e2143d4" → (1, 3, 3).
+    Missing or unparseable parts compare as 0 so a malformed override can't crash startup.
+    """
+    m = _VER_RE.match(version)
+    if not m:
+        return (0, 0, 0)
+    return (int(m.group("major")), int(m.group("minor") or 0), int(m.group("patch") or 0))
+
+# Backend choice is cheap and needed by FALLBACK_TEMPLATE; the wrapper
+# import itself is deferred to load_sdl_backend().
+use_sdl2 = version_tuple(ryujinx_version) <= _SDL3_CUTOFF
+backend_string = "GamepadSDL2" if use_sdl2 else "GamepadSDL3"
+
+@cache
+def load_sdl_backend():
+    """
+    Import the SDL wrapper matching the detected Ryujinx version and point
+    its loader at ryujinx_dir. Runs once; returns the SDLManager class.
+    """
+    if use_sdl2:
+        log("INFO", "SDL backend (library dir)", "SDL2", ryujinx_dir)
+        os.environ["PYSDL2_DLL_PATH"] = ryujinx_dir
+        from ControllerManagerSDL2 import SDLManager
+    else:
+        log("INFO", "SDL backend (library dir)", "SDL3", ryujinx_dir)
+        os.environ["SDL_BINARY_PATH"] = ryujinx_dir  # Always Ryujinx's own SDL3 build
+        # PySDL3 loader switches — only filled in when not already set, so they
+        # can be overridden from the environment without editing the launcher.
+        _SDL3_ENV = {
+            "SDL_DOWNLOAD_BINARIES":        "0",  # Disable SDL Lib Download, "1" by default.
+            "SDL_DISABLE_METADATA":         "1",  # Disable metadata method, "0" by default.
+            "SDL_CHECK_BINARY_VERSION":     "0",  # Disable binary version checking, "1" by default.
+            "SDL_IGNORE_MISSING_FUNCTIONS": "1",  # Disable missing function warnings, "1" by default.
+            "SDL_FIND_BINARIES":            "1",  # Search for binaries in the system libraries, "1" by default.
+        }
+        for key, value in _SDL3_ENV.items():
+            os.environ.setdefault(key, value)
+        from ControllerManagerSDL3 import SDLManager
+
+    SDLManager.error_callback = messagebox.showerror  # Driver errors surface as dialogs
+    return SDLManager
 
 # ============================================================================
 # SECTION 9: DEFAULT CONTROLLER MAPPING TEMPLATE
@@ -535,9 +658,58 @@ FALLBACK_TEMPLATE = {
     }
 }
 
+# Freeze the fallback (read-only views at both levels) so a missed clone
+# raises TypeError instead of silently corrupting every later controller.
+FALLBACK_TEMPLATE = MappingProxyType({
+    k: (MappingProxyType(v) if isinstance(v, dict) else v)
+    for k, v in FALLBACK_TEMPLATE.items()
+})
+
+def clone_template(template=FALLBACK_TEMPLATE):
+    """
+    Fresh, independently mutable copy of a controller template.
+    Templates are one level of dicts over primitives, so copying each sub-dict
+    is a full deep copy without copy.deepcopy's memo/dispatch overhead.
+    Sub-dicts are always materialized as real dicts — json can't dump proxies.
+    Never mutate a loaded master template directly either.
+    """
+    return {k: (dict(v) if isinstance(v, (dict, MappingProxyType)) else v)
+            for k, v in template.items()}
+
+# SDL hex GUID → Ryujinx GUID (000000XX-YYZZ-AABB-CCCC-DDDDDDDDDDDD) as a fixed
+# character permutation; only the first group depends on the Ryujinx version.
+if ryujinx_version == "1.1.1403":
+    # v1.1.1403: Standard endian swap of first 4 bytes (e.g. 8d930003)
+    _GUID_HEAD = ((6, 7, 4, 5, 2, 3, 0, 1), "%s" * 8)
+else:
+    # v1.3.1/v1.3.2/v1.3.3: Bus ID masked (e.g. 00000003)
+    _GUID_HEAD = ((0, 1), "000000%s%s")
+
+_GUID_PICK = itemgetter(
+    *_GUID_HEAD[0],
+    10, 11, 8, 9,           # Endian swap
+    14, 15, 12, 13,         # Endian swap
+    *range(16, 32),         # Remaining 8 bytes unchanged
+)
+_GUID_LAYOUT = _GUID_HEAD[1] + "-" + "%s" * 4 + "-" + "%s" * 4 + "-" + "%s" * 4 + "-" + "%s" * 12
+
+# Per-version input entry shape, resolved once: keys older Ryujinx builds
+# don't understand are stripped from the master template at load time
+if ryujinx_version == "1.1.1403":
+    _TEMPLATE_DROP_KEYS = ("led", "name")   # Ryujinx (v1.1.1403)
+elif ryujinx_version == "1.3.1":
+    _TEMPLATE_DROP_KEYS = ("name",)         # Ryujinx (v1.3.1)
+else:
+    _TEMPLATE_DROP_KEYS = ()                # Ryujinx (v1.3.2/v1.3.3/All New version)
+_ENTRY_HAS_NAME = "name" not in _TEMPLATE_DROP_KEYS
+
 # ============================================================================
 # SECTION 10: DYNAMIC SCALING UTILITY
 # ============================================================================
+_INV_BASE_WIDTH  = 1.0 / 1280  # Baseline 720p width
+_INV_BASE_HEIGHT = 1.0 / 720   # Baseline 720p height
+
+@lru_cache(maxsize=8)  # Only a handful of resolutions per session
 def calculate_scale(screen_width, screen_height):
     """
     Calculate uniform scale factor based on screen resolution.
@@ -545,21 +717,16 @@ def calculate_scale(screen_width, screen_height):
 
     Returns uniform scale that maintains aspect ratio
     """
-    BASE_WIDTH = 1280
-    BASE_HEIGHT = 720
-
-    # Calculate scale based on both dimensions
-    width_scale = screen_width / BASE_WIDTH
-    height_scale = screen_height / BASE_HEIGHT
+    # Smaller of the two axis scales so everything fits; 0.2 floor for very small screens
+    return max(0.2, min(screen_width * _INV_BASE_WIDTH, screen_height * _INV_BASE_HEIGHT))
 
-    # Use the smaller scale to ensure everything fits
-    scale = min(width_scale, height_scale)
+_NAME_SUFFIX_RE = re.compile(r'\s*\(\d+\)$')  # Trailing " (2)" index suffix
 
-    # Minimum scale for very small screens
-    if scale < 0.2:
-        scale = 0.2
+@lru_cache(maxsize=64)
+def clean_display_name(display_name):
+    """Strip SDL's trailing index suffix, e.g. "Xbox Controller (2)" → "Xbox Controller"."""
+    return _NAME_SUFFIX_RE.sub('', display_name)
 
-    return scale
 # ============================================================================
 # SECTION 11: MAIN APPLICATION CLASS
 # ============================================================================
@@ -577,28 +744,6 @@ class RyujinxLauncherApp:
         self.root.configure(fg_color=COLOR['BG_DARK'])
         self.root.attributes('-fullscreen', True)
 
-        # Update 1: Define the specific filenames from your assets folder
-        ico_path = resource_path(os.path.join("assets", "RyujinxLauncherIcon.ico"))
-        png_path = resource_path(os.path.join("assets", "RyujinxLauncherPNG.png"))
-
-        # Update 2: Robust Icon Loading
-        # Windows prefers .ico for the taskbar
-        if os.path.exists(ico_path):
-            try:
-                self.root.iconbitmap(default=ico_path)
-            except Exception:
-                pass
-
-        # Linux/macOS often prefer .png (iconphoto)
-        # We try this if the .ico didn't work, or as a secondary measure
-        elif os.path.exists(png_path):
-            try:
-                # Use the PNG for the window icon if on Linux/macOS
-                icon_img = tk.PhotoImage(file=png_path)
-                self.root.iconphoto(True, icon_img)
-            except Exception:
-                pass
-
         # Keyboard shortcuts for accessibility
         self.root.bind("<Return>", lambda e: self.handle_enter_key())
         self.root.bind("<Escape>", lambda e: self.handle_esc_key())
@@ -609,6 +754,7 @@ class RyujinxLauncherApp:
         self.screen_height = self.root.winfo_screenheight()
         self.scale = calculate_scale(self.screen_width, self.screen_height)
         self.resize_job = None
+        self.window_size = (self.screen_width, self.screen_height)  # Last root size seen by on_window_configure
 
         ctk.set_window_scaling(self.scale)  # Scales the window size
         ctk.set_widget_scaling(self.scale)  # Scales the buttons, fonts, and elements inside
@@ -616,21 +762,88 @@ class RyujinxLauncherApp:
         # Bind the configure event to detect resolution/scale changes
         self.root.bind("<Configure>", self.on_window_configure)
 
+        # Closing the window goes through the same cleanup as every other exit
+        self.root.protocol("WM_DELETE_WINDOW", self.shutdown)
+
         # Initialize SDL2/SDL3 controller subsystem
         SDLManager.SDL_Init()
 
         # State management
         self.controllers = {}               # {instance_id: SDL_GameController}
         self.assignments = []               # [(hid_path, display_name), ...] - Player order
+        self.assigned_paths = {}            # {hid_path: index into assignments} - O(1) lookup
         self.hardware_map = {}              # {instance_id: (hid_path, display_name)} - Currently connected
-        self.color_pool = list(COLOR_POOL) # Copy the pool to modify it locally
-        random.shuffle(self.color_pool)     # Shuffle the color pool
+        self.kill_held = {}                 # {instance_id: bitmask of held Back/L/R} - Kill combo state
+        self.color_pool = deque(random.sample(COLOR_POOL, len(COLOR_POOL)))  # Shuffled once per session
         self.hid_colors = {}                # Dictionary to remember {hid_path: color_hex}
         self.alert_mode = None              # Current alert type (if any)
         self.alert_frame = None             # Alert dialog container
         self.ryujinx_process = None         # Ryujinx subprocess handle
         self.toast_job = None               # Toast notification timer
+        self.closing = False                # Set once by shutdown()
+        self.grid_dirty = False             # Assignments changed; update_loop repaints once per tick
         self.returning_to_launcher = False  # Flag for kill→restart flow
+        self.idle_ticks = 0                 # Consecutive update_loop ticks without SDL events
+
+        # Launch mode is fixed by the command line — resolve UI strings once
+        self.launch_target = "GAME" if len(sys.argv) > 1 else "RYUJINX"
+        self.title_text = f"{self.launch_target} CONTROLLER SETUP"
+        self.launch_footer_text = f"☰ LAUNCH {self.launch_target}"
+
+        # Alert dialogs: mode → (title, title color, body text, ((button text, color), ...))
+        self.alert_specs = {
+            "LAUNCH": (
+                "⚠️ NO CONTROLLERS", COLOR['ALERT_YELLOW'],
+                "Ryujinx will launch with default inputs.",
+                ((f"Ⓐ LAUNCH {self.launch_target}", COLOR['NEON_BLUE']),
+                 ("Ⓑ BACK", COLOR['NEON_RED'])),
+            ),
+            "EXIT": (
+                "EXIT LAUNCHER?", COLOR['TEXT_WHITE'],
+                "Are you sure you want to quit?",
+                (("Ⓐ YES", COLOR['NEON_BLUE']),
+                 ("Ⓑ NO", COLOR['NEON_RED'])),
+            ),
+            "KILL_CONFIRM": (
+                "KILL GAME?", COLOR['TEXT_WHITE'],
+                "How would you like to proceed?",
+                (("Ⓐ LAUNCHER", COLOR['NEON_BLUE']),     # Return to launcher for controller reconfiguration
+                 ("Ⓨ DESKTOP", COLOR['ALERT_YELLOW']),   # Exit to desktop
+                 ("Ⓑ CANCEL", COLOR['NEON_RED'])),       # Cancel and resume game
+            ),
+        }
+
+        # Gamepad button → action, per mode (button constants resolved once here)
+        BTN_A     = SDLManager.SDL_CONTROLLER_BUTTON_A
+        BTN_B     = SDLManager.SDL_CONTROLLER_BUTTON_B
+        BTN_Y     = SDLManager.SDL_CONTROLLER_BUTTON_Y
+        BTN_START = SDLManager.SDL_CONTROLLER_BUTTON_START
+        BTN_BACK  = SDLManager.SDL_CONTROLLER_BUTTON_BACK
+
+        # Normal mode actions take the instance ID of the pressing controller
+        self.normal_actions = {
+            BTN_A:     self.assign_player,                           # Assign controller
+            BTN_B:     self.remove_player,                           # Remove assignment
+            BTN_START: lambda which: self.check_launch(),            # Launch Ryujinx
+            BTN_BACK:  lambda which: self.show_exit_confirmation(),  # Exit launcher
+        }
+
+        # Alert mode actions take no arguments
+        self.alert_actions = {
+            "KILL_CONFIRM": {                    # Three-option kill menu
+                BTN_A: self.kill_and_restart,    # Return to launcher
+                BTN_Y: self.kill_and_quit,       # Exit to desktop
+                BTN_B: self.resume_game,         # Cancel, resume game
+            },
+            "LAUNCH": {
+                BTN_A: self.force_launch,
+                BTN_B: self.close_alert,
+            },
+            "EXIT": {
+                BTN_A: self.shutdown,
+                BTN_B: self.close_alert,
+            },
+        }
 
         # Load existing controller mapping template from Config.json
         self.master_template = self.load_config_data(CONFIG_FILE)
@@ -638,38 +851,76 @@ class RyujinxLauncherApp:
         # Build UI
         self.build_ui()
 
+        # Initial controller enumeration (hot-plug is event-driven after this)
+        self.scan_controllers()
+
         # Start main loop
         self.update_loop()
 
+        # Window icon is cosmetic — load it once the UI is up
+        self.root.after(0, self.load_window_icon)
+
+    def load_window_icon(self):
+        """Set the window/taskbar icon from the bundled assets."""
+        # Update 1: Define the specific filenames from your assets folder
+        ico_path = resource_path(os.path.join("assets", "RyujinxLauncherIcon.ico"))
+        png_path = resource_path(os.path.join("assets", "RyujinxLauncherPNG.png"))
+
+        # Update 2: Robust Icon Loading
+        # Windows prefers .ico for the taskbar
+        if os.path.exists(ico_path):
+            try:
+                self.root.iconbitmap(default=ico_path)
+            except Exception:
+                pass
+
+        # Linux/macOS often prefer .png (iconphoto)
+        # We try this if the .ico didn't work, or as a secondary measure
+        elif os.path.exists(png_path):
+            try:
+                # Use the PNG for the window icon if on Linux/macOS
+                icon_img = tk.PhotoImage(file=png_path)
+                self.root.iconphoto(True, icon_img)
+            except Exception:
+                pass
+
     def on_window_configure(self, event):
         """
         Handle window resize events (resolution or scale change).
         Uses a timer (debounce) to wait for the resize to finish before rebuilding UI.
         """
-        if event.widget != self.root:
+        if event.widget is not self.root:
             return
 
-        new_w = self.root.winfo_screenwidth()
-        new_h = self.root.winfo_screenheight()
+        # The root window is fullscreen, so its size tracks the screen's. Compare
+        # the event's own size instead of asking Tcl for the screen size on every
+        # Configure. A repeat of the size already seen (or already pending) is a no-op
+        new_size = (event.width, event.height)
+        if new_size == self.window_size:
+            return
+        self.window_size = new_size
 
-        # Only trigger if dimensions actually changed
-        if new_w != self.screen_width or new_h != self.screen_height:
-            # Cancel previous timer if user is still resizing/changing settings
-            if self.resize_job:
-                self.root.after_cancel(self.resize_job)
+        # Cancel previous timer if user is still resizing/changing settings
+        if self.resize_job:
+            self.root.after_cancel(self.resize_job)
 
-            # Schedule a rebuild in 100ms
-            self.resize_job = self.root.after(100, self.perform_resize)
+        # Schedule a rebuild in 100ms
+        self.resize_job = self.root.after(100, self.perform_resize)
 
     def perform_resize(self):
         """
         Actually rebuild the UI with the new scale factor.
         """
+        self.resize_job = None
         self.screen_width = self.root.winfo_screenwidth()
         self.screen_height = self.root.winfo_screenheight()
 
-        # Recalculate scale
-        self.scale = calculate_scale(self.screen_width, self.screen_height)
+        # Recalculate scale — widget sizes and fonts are unscaled constants,
+        # so an unchanged factor means the current UI is already correct
+        scale = calculate_scale(self.screen_width, self.screen_height)
+        if scale == self.scale:
+            return
+        self.scale = scale
 
         ctk.set_window_scaling(self.scale)  # Scales the window size
         ctk.set_widget_scaling(self.scale)  # Scales the buttons, fonts, and elements inside
@@ -688,17 +939,9 @@ class RyujinxLauncherApp:
         # Restore controller assignment visuals onto the new UI
         self.refresh_grid()
 
+        # build_ui replaced the alert overlay too — re-show it if one was up
         if self.alert_mode:
-            # 1. Capture current mode
-            mode = self.alert_mode
-
-            # 2. Destroy the old, wrongly scaled/positioned alert frame
-            if self.alert_frame:
-                self.alert_frame.destroy()
-                self.alert_frame = None
-
-            # 3. Re-draw the alert (This forces it to the top of the stack)
-            self.show_alert(mode)
+            self.show_alert(self.alert_mode)
 
     def build_ui(self):
         """Build the entire UI using scaled values"""
@@ -717,13 +960,10 @@ class RyujinxLauncherApp:
         )
 
         # Header: Title
-        mode_prefix = "GAME" if len(sys.argv) > 1 else "RYUJINX"
-        title_text = f"{mode_prefix} CONTROLLER SETUP"
-
         self.lbl_title = ctk.CTkLabel(
             self.main_container,
-            text=title_text,
-            font=(UI['FONT_FAMILY'], UI['FONT_TITLE_SIZE'], "bold"),
+            text=self.title_text,
+            font=FONT['TITLE'],
             fg_color="transparent",
             text_color=COLOR['TEXT_WHITE']
         )
@@ -738,7 +978,10 @@ class RyujinxLauncherApp:
         self.grid_frame = ctk.CTkFrame(self.main_container, fg_color=COLOR['BG_DARK'], corner_radius=0)
         self.grid_frame.pack()
 
-        self.slot_cards = []
+        # Slot widgets as parallel per-kind lists (index = player slot)
+        self.cards, self.lbl_nums, self.lbl_statuses, self.lbl_discs = [], [], [], []
+        self.slot_state = [None] * 8  # What each card currently shows (see refresh_grid)
+        card_label = {'font': FONT['CARD'], 'fg_color': "transparent"}  # Shared by every card label
         for i in range(8):
             row = i // 2
             col = i % 2
@@ -762,38 +1005,23 @@ class RyujinxLauncherApp:
             )
 
             # Player number label (top-left corner)
-            lbl_num = ctk.CTkLabel(
-                card,
-                text=f"P{i+1}",
-                font=(UI['FONT_FAMILY'], UI['FONT_CARD_SIZE'], "bold"),
-                fg_color="transparent",
-                text_color="#444444"
-            )
+            lbl_num = ctk.CTkLabel(card, text=f"P{i+1}", text_color="#444444", **card_label)
             lbl_num.place(
                 x=UI['CARD_PLAYER_NUM_X'],
                 y=UI['CARD_PLAYER_NUM_Y']
             )
 
             # Status/name label (center)
-            lbl_status = ctk.CTkLabel(
-                card,
-                text="PRESS Ⓐ CONNECT",
-                font=(UI['FONT_FAMILY'], UI['FONT_CARD_SIZE'], "bold"),
-                fg_color="transparent",
-                text_color=COLOR['TEXT_DIM']
-            )
+            lbl_status = ctk.CTkLabel(card, text="PRESS Ⓐ CONNECT", text_color=COLOR['TEXT_DIM'], **card_label)
             lbl_status.place(relx=0.5, rely=0.5, anchor="center")
 
             # Disconnect hint label (bottom, initially hidden)
-            lbl_disc = ctk.CTkLabel(
-                card,
-                text="Ⓑ DISCONNECT",
-                font=(UI['FONT_FAMILY'], UI['FONT_CARD_SIZE'], "bold"),
-                fg_color="transparent",
-                text_color=COLOR['NEON_RED']
-            )
+            lbl_disc = ctk.CTkLabel(card, text="Ⓑ DISCONNECT", text_color=COLOR['NEON_RED'], **card_label)
 
-            self.slot_cards.append((card, lbl_num, lbl_status, lbl_disc))
+            self.cards.append(card)
+            self.lbl_nums.append(lbl_num)
+            self.lbl_statuses.append(lbl_status)
+            self.lbl_discs.append(lbl_disc)
 
         # Footer: Button hints
         self.footer_frame = ctk.CTkFrame(
@@ -805,29 +1033,10 @@ class RyujinxLauncherApp:
         self.footer_frame.pack(side="bottom", fill="x")
         self.footer_frame.pack_propagate(False)
 
-        launch_target = "GAME" if len(sys.argv) > 1 else "RYUJINX"
-
-        self.separator_text = ctk.CTkLabel(
-            self.footer_frame,
-            text="|",
-            font=(UI['FONT_FAMILY'], UI['FONT_FOOTER_SIZE'], "bold"),
-            fg_color="transparent",
-            text_color=COLOR['TEXT_WHITE']
-        )
-        self.launch_text = ctk.CTkLabel(
-            self.footer_frame,
-            text=f"☰ LAUNCH {launch_target}",
-            font=(UI['FONT_FAMILY'], UI['FONT_FOOTER_SIZE'], "bold"),
-            fg_color="transparent",
-            text_color=COLOR['TEXT_WHITE']
-        )
-        self.quit_text = ctk.CTkLabel(
-            self.footer_frame,
-            text="⧉ QUIT",
-            font=(UI['FONT_FAMILY'], UI['FONT_FOOTER_SIZE'], "bold"),
-            fg_color="transparent",
-            text_color=COLOR['TEXT_WHITE']
-        )
+        footer_label = {'font': FONT['FOOTER'], 'fg_color': "transparent", 'text_color': COLOR['TEXT_WHITE']}
+        self.separator_text = ctk.CTkLabel(self.footer_frame, text="|", **footer_label)
+        self.launch_text = ctk.CTkLabel(self.footer_frame, text=self.launch_footer_text, **footer_label)
+        self.quit_text = ctk.CTkLabel(self.footer_frame, text="⧉ QUIT", **footer_label)
 
         gap = UI['FOOTER_GAP']
         self.separator_text.place(relx=0.5, rely=0.5, anchor="center")
@@ -838,13 +1047,16 @@ class RyujinxLauncherApp:
         self.lbl_toast = ctk.CTkLabel(
             self.main_container,
             text="",
-            font=(UI['FONT_FAMILY'], UI['FONT_TOAST_SIZE'], "bold"),
+            font=FONT['TOAST'],
             fg_color="transparent",
             text_color=COLOR['NEON_RED']
         )
         self.lbl_toast.place(relx=0.5, rely=UI['TOAST_POSITION_Y'], anchor="center")
         self.lbl_toast.place_forget()
 
+        # Alert overlay (hidden until show_alert)
+        self.build_alert()
+
     # ========================================================================
     # CONFIGURATION MANAGEMENT
     # ========================================================================
@@ -853,18 +1065,19 @@ class RyujinxLauncherApp:
         Load existing controller mapping template from Ryujinx Config.json.
 
         Returns:
-            dict: Controller configuration template, or FALLBACK_TEMPLATE if not found
+            dict: Controller configuration template, or FALLBACK_TEMPLATE if not found,
+                  minus any keys the detected Ryujinx version doesn't accept
         """
         template = FALLBACK_TEMPLATE
         if os.path.exists(file_path):
             try:
-                with open(file_path, 'r') as f:
-                    data = json.load(f)
+                with open(file_path, 'rb') as f:
+                    data = json_loads(f.read())
                 if "input_config" in data and isinstance(data["input_config"], list):
                     for entry in data["input_config"]:
                         if (entry.get("backend") in ("GamepadSDL2", "GamepadSDL3") and
                             entry.get("controller_type") == "ProController"):
-                            template = copy.deepcopy(entry)
+                            template = entry  # Freshly parsed and otherwise unreferenced — no copy needed
                             break
             except Exception as e:
                 log("ERROR", "Config file corrupted", file_path)
@@ -877,6 +1090,10 @@ class RyujinxLauncherApp:
                     "Then try launching this tool again."
                 )
                 sys.exit(1)  # Stop the launcher immediately
+
+        if _TEMPLATE_DROP_KEYS:
+            # Shallow filter — clone_template copies the sub-dicts per entry
+            template = {k: v for k, v in template.items() if k not in _TEMPLATE_DROP_KEYS}
         return template
 
     def ryujinx_guid_fix(self, raw_hex):
@@ -895,19 +1112,8 @@ class RyujinxLauncherApp:
         if len(raw_hex) < 32:
             return raw_hex  # Invalid GUID, return as-is
 
-        if ryujinx_version == "1.1.1403":
-            # v1.1.1403: Standard endian swap of first 4 bytes (e.g. 8d930003)
-            part1 = raw_hex[6:8] + raw_hex[4:6] + raw_hex[2:4] + raw_hex[:2]
-        else:
-            # v1.3.1/v1.3.2/v1.3.3: Bus ID masked (e.g. 00000003)
-            bus_id = raw_hex[:2]
-            part1 = f"000000{bus_id}"
-        part2 = raw_hex[10:12] + raw_hex[8:10]   # Endian swap
-        part3 = raw_hex[14:16] + raw_hex[12:14]  # Endian swap
-        part4_a = raw_hex[16:20]
-        part4_b = raw_hex[20:]
-
-        return f"{part1}-{part2}-{part3}-{part4_a}-{part4_b}"
+        # One C-level gather of the permuted hex chars, one %-format for the dashes
+        return _GUID_LAYOUT % _GUID_PICK(raw_hex)
 
     # ========================================================================
     # UI FEEDBACK METHODS
@@ -935,8 +1141,7 @@ class RyujinxLauncherApp:
         if self.alert_mode == "LAUNCH":
             self.force_launch()
         elif self.alert_mode == "EXIT":
-            unmount_appimage()
-            self.root.destroy()
+            self.shutdown()
         elif self.alert_mode == "KILL_CONFIRM":
             self.kill_and_quit()
 
@@ -950,14 +1155,33 @@ class RyujinxLauncherApp:
     # ========================================================================
     # PROCESS MANAGEMENT
     # ========================================================================
+    def shutdown(self):
+        """
+        Single exit path: cancel pending timers, release SDL and the AppImage
+        mount, then destroy the root (mainloop returns). Safe to call twice.
+        """
+        if self.closing:
+            return
+        self.closing = True
+
+        for job in (self.resize_job, self.toast_job):
+            if job:
+                self.root.after_cancel(job)
+        SDLManager.SDL_Quit()
+        unmount_appimage()
+        self.root.destroy()
+
     def kill_and_quit(self):
         """Kill Ryujinx process and exit launcher (used by kill menu → Desktop option)."""
         if self.ryujinx_process:
             self.ryujinx_process.kill()
             log("INFO", "Ryujinx killed — exiting to desktop")
-        unmount_appimage()
-        self.root.quit()
-        sys.exit()
+        self.shutdown()
+
+    def resume_game(self):
+        """Dismiss the kill menu and hide the launcher again (kill menu → Cancel option)."""
+        self.close_alert()
+        self.root.withdraw()
 
     def kill_and_restart(self):
         """
@@ -965,8 +1189,9 @@ class RyujinxLauncherApp:
 
         Sets flag to prevent automatic exit when process terminates.
         """
+        # Set before kill() — update_loop runs on this same Tk thread, so it
+        # can only observe the exit after this handler returns
         self.returning_to_launcher = True
-        time.sleep(0.005)  # 5ms delay for flag to propagate
 
         if self.ryujinx_process:
             self.ryujinx_process.kill()
@@ -975,156 +1200,111 @@ class RyujinxLauncherApp:
 
         # Reset launcher state for fresh assignment
         self.assignments = []
+        self.assigned_paths = {}
         self.refresh_grid()
         self.close_alert()
         self.root.deiconify()
         self.root.state('normal')
 
+    # ========================================================================
+    # RYUJINX PROCESS MONITORING
+    # ========================================================================
+    def watch_ryujinx(self, proc):
+        """
+        Check every PROCESS_POLL_MS whether the launched Ryujinx has exited
+        (kept off the input loop — an exit only needs noticing, not a 60 Hz check).
+
+        Args:
+            proc (subprocess.Popen): Process this watcher was started for
+        """
+        if self.ryujinx_process is not proc:
+            return  # Killed via kill_and_restart (or replaced) — stop watching
+
+        # Still running, or the kill menu is up — check again later
+        if self.alert_mode or proc.poll() is None:
+            self.root.after(PROCESS_POLL_MS, self.watch_ryujinx, proc)
+            return
+
+        if self.returning_to_launcher:
+            # User chose "Launcher" from kill menu - reset and show UI
+            log("INFO", "Ryujinx exited — returning to launcher")
+            self.assignments = []
+            self.assigned_paths = {}
+            self.refresh_grid()
+            self.root.deiconify()
+            self.root.state('normal')
+            self.ryujinx_process = None
+            self.returning_to_launcher = False
+        else:
+            # Ryujinx closed normally or crashed - exit launcher
+            log("INFO", "Ryujinx exited — closing launcher")
+            self.shutdown()
+
     # ========================================================================
     # MAIN EVENT LOOP
     # ========================================================================
     def update_loop(self):
         """
-        Main event processing loop (runs every 16ms).
+        Main event processing loop (runs every UPDATE_INTERVAL_MS, or
+        IDLE_INTERVAL_MS after IDLE_AFTER_TICKS ticks without SDL events).
 
         Handles:
-        - Ryujinx process monitoring
         - Kill combo detection
-        - Controller hot-plug detection
+        - Controller hot-plug events
         - Gamepad button events
         """
+        # Hot-path constants as locals (LOAD_FAST instead of class lookups)
+        BUTTON_DOWN     = SDLManager.SDL_CONTROLLERBUTTONDOWN
+        BUTTON_UP       = SDLManager.SDL_CONTROLLERBUTTONUP
+        DEVICE_ADDED    = SDLManager.SDL_CONTROLLERDEVICEADDED
+        DEVICE_REMOVED  = SDLManager.SDL_CONTROLLERDEVICEREMOVED
 
         # ====================================================================
-        # RYUJINX PROCESS MONITORING
+        # SDL EVENT PROCESSING (HOT-PLUG + GAMEPAD BUTTONS)
         # ====================================================================
-        if self.ryujinx_process and not self.alert_mode:
-            # Check if Ryujinx has exited
-            if self.ryujinx_process.poll() is not None:
-                if self.returning_to_launcher:
-                    # User chose "Launcher" from kill menu - reset and show UI
-                    log("INFO", "Ryujinx exited — returning to launcher")
-                    self.assignments = []
-                    self.refresh_grid()
-                    self.root.deiconify()
-                    self.root.state('normal')
-                    self.ryujinx_process = None
-                    self.returning_to_launcher = False
-                else:
-                    # Ryujinx closed normally or crashed - exit launcher
-                    log("INFO", "Ryujinx exited — closing launcher")
-                    self.root.quit()
-                    sys.exit()
+        events = SDLManager.SDL_DrainEvents()
+        self.idle_ticks = 0 if events else self.idle_ticks + 1
+
+        for event in events:
+            if self.closing:
+                return  # A handler below shut the launcher down — drop the rest
 
             # ================================================================
-            # GLOBAL KILL COMBO DETECTION (ANY CONTROLLER)
+            # CONTROLLER HOT-PLUG (DEVICE EVENTS)
             # ================================================================
-            # Checks all connected controllers for Back+L+R press
-            # Global approach allows recovery if Player 1's controller fails
-            kill_combo = False
-            for ctrl in self.controllers.values():
-                if (SDLManager.SDL_GameControllerGetButton(ctrl, SDLManager.SDL_CONTROLLER_BUTTON_BACK) and
-                    SDLManager.SDL_GameControllerGetButton(ctrl, SDLManager.SDL_CONTROLLER_BUTTON_LEFT_SHOULDER) and
-                    SDLManager.SDL_GameControllerGetButton(ctrl, SDLManager.SDL_CONTROLLER_BUTTON_RIGHT_SHOULDER)):
-                    kill_combo = True
-                    break
-
-            if kill_combo:
-                self.root.deiconify()  # Bring launcher to foreground
-                log("INFO", "Kill combo detected — showing menu")
-                self.show_alert("KILL_CONFIRM")
-                self.root.after(16, self.update_loop)
-                return
-
-        # ====================================================================
-        # CONTROLLER HARDWARE DETECTION (HOT-PLUG SUPPORT)
-        # ====================================================================
-        self.hardware_map.clear()
-
-        # Scan all connected controllers and build current hardware map
-        for joystick_id in SDLManager.SDL_GetJoystickIDs():
-            if not SDLManager.SDL_IsGameController(joystick_id):
-                continue  # Skip non-gamepad devices (e.g., flight sticks)
-
-            ctrl = SDLManager.SDL_GameControllerOpen(joystick_id)
-            if ctrl:
-                joy = SDLManager.SDL_GameControllerGetJoystick(ctrl)
-                instance_id = SDLManager.SDL_JoystickInstanceID(joy)
-
-                # Cache controller handle for button polling
-                if instance_id not in self.controllers:
-                    self.controllers[instance_id] = ctrl
+            if event.type == DEVICE_ADDED:
+                self.add_controller(SDLManager.get_device_info(event))
 
-                raw_name = SDLManager.SDL_GameControllerName(ctrl).decode()
+            elif event.type == DEVICE_REMOVED:
+                self.remove_controller(SDLManager.get_device_info(event))
 
-                # Get HID path (hardware-specific, persists across reconnects)
-                try:
-                    path_bytes = SDLManager.SDL_GameControllerPath(ctrl)
-                    hid_path = path_bytes.decode() if path_bytes else f"UNK_{instance_id}"
-                except:
-                    hid_path = f"UNK_{instance_id}"  # Fallback for unsupported platforms
-
-                self.hardware_map[instance_id] = (hid_path, raw_name)
-
-        # ====================================================================
-        # HOT-PLUG DISCONNECT DETECTION
-        # ====================================================================
-        # Compare current hardware against assigned controllers
-        # Remove assignments for disconnected controllers
-        new_assignments = []
-        dropped_names = []
-
-        current_connected_paths = set(path for path, _ in self.hardware_map.values())
-
-        for path, name in self.assignments:
-            if path in current_connected_paths:
-                new_assignments.append((path, name))  # Still connected, keep assignment
-            else:
-                dropped_names.append((path,name))  # Disconnected, remove assignment
+            elif event.type == BUTTON_UP:
+                button, which = SDLManager.get_button_info(event)
+                self.track_kill_combo(which, button, False)
 
-        # Update state if any controllers were removed
-        if len(new_assignments) != len(self.assignments):
-            self.assignments = new_assignments
-            self.refresh_grid()
+            elif event.type == BUTTON_DOWN:
+                button, which = SDLManager.get_button_info(event)
 
-            # Show toast notification for first disconnected controller
-            if dropped_names:
-                self.show_toast(f"⚠️ {dropped_names[0][1]} Disconnected!", self.hid_colors[dropped_names[0][0]])
-                for path, name in dropped_names:
-                    log("INFO", "Controller disconnected", name)
-                    color = self.hid_colors.pop(path, None)
-                    if color:
-                        self.color_pool.append(color)
+                # ============================================================
+                # GLOBAL KILL COMBO DETECTION (ANY CONTROLLER)
+                # ============================================================
+                # Back+L+R held on any controller while Ryujinx runs
+                # Global approach allows recovery if Player 1's controller fails
+                if (self.track_kill_combo(which, button, True)
+                        and self.ryujinx_process and not self.alert_mode):
+                    self.root.deiconify()  # Bring launcher to foreground
+                    self.refresh_grid()    # Catch up on disconnects while hidden
+                    log("INFO", "Kill combo detected — showing menu")
+                    self.show_alert("KILL_CONFIRM")
+                    continue
 
-        # ====================================================================
-        # GAMEPAD BUTTON EVENT PROCESSING
-        # ====================================================================
-        event = SDLManager.SDL_Event()
-        while SDLManager.SDL_PollEvent(ctypes.byref(event)) != 0:
-            if event.type == SDLManager.SDL_CONTROLLERBUTTONDOWN:
-                button, which = SDLManager.get_button_info(event)
                 # ============================================================
                 # ALERT MODE HANDLERS
                 # ============================================================
                 if self.alert_mode:
-                    if self.alert_mode == "KILL_CONFIRM":
-                        # Three-option kill menu
-                        if button == SDLManager.SDL_CONTROLLER_BUTTON_A:
-                            self.kill_and_restart()  # Return to launcher
-                        elif button == SDLManager.SDL_CONTROLLER_BUTTON_Y:
-                            self.kill_and_quit()  # Exit to desktop
-                        elif button == SDLManager.SDL_CONTROLLER_BUTTON_B:
-                            self.close_alert()
-                            self.root.withdraw()  # Cancel, resume game
-                    else:
-                        # Standard two-option alerts (launch/exit confirmations)
-                        if button == SDLManager.SDL_CONTROLLER_BUTTON_A:
-                            if self.alert_mode == "LAUNCH":
-                                self.force_launch()
-                            elif self.alert_mode == "EXIT":
-                                unmount_appimage()
-                                self.root.destroy()
-                        elif button == SDLManager.SDL_CONTROLLER_BUTTON_B:
-                            self.close_alert()
+                    action = self.alert_actions[self.alert_mode].get(button)
+                    if action:
+                        action()
 
                 # ============================================================
                 # NORMAL MODE HANDLERS
@@ -1134,21 +1314,145 @@ class RyujinxLauncherApp:
                     if self.ryujinx_process:
                         continue
 
-                    if button == SDLManager.SDL_CONTROLLER_BUTTON_A:
-                        self.assign_player(which)  # Assign controller
-                    elif button == SDLManager.SDL_CONTROLLER_BUTTON_B:
-                        self.remove_player(which)  # Remove assignment
-                    elif button == SDLManager.SDL_CONTROLLER_BUTTON_START:
-                        self.check_launch()        # Launch Ryujinx
-                    elif button == SDLManager.SDL_CONTROLLER_BUTTON_BACK:
-                        self.show_exit_confirmation()  # Exit launcher
+                    action = self.normal_actions.get(button)
+                    if action:
+                        action(which)
 
             elif event.type == SDLManager.SDL_QUIT:
-                unmount_appimage()
-                self.root.destroy()
+                self.shutdown()
+
+        if self.closing:
+            return  # Root is gone — don't reschedule
 
-        # Schedule next update in 16ms
-        self.root.after(16, self.update_loop)
+        # One repaint for however many assign/remove presses this tick drained
+        if self.grid_dirty:
+            self.grid_dirty = False
+            self.refresh_grid()
+
+        # Schedule next update (full rate while input is flowing, slower when idle).
+        # While the game runs the launcher is hidden and only watches for the
+        # kill combo, so gameplay input doesn't keep it at full rate
+        if self.ryujinx_process and not self.alert_mode:
+            interval = IDLE_INTERVAL_MS
+        else:
+            interval = UPDATE_INTERVAL_MS if self.idle_ticks < IDLE_AFTER_TICKS else IDLE_INTERVAL_MS
+        self.root.after(interval, self.update_loop)
+
+    # ========================================================================
+    # CONTROLLER HARDWARE TRACKING (HOT-PLUG SUPPORT)
+    # ========================================================================
+    def scan_controllers(self):
+        """
+        One-shot enumeration of every connected controller (startup / SDL re-init).
+        After this, hardware_map is kept current by device added/removed events.
+        """
+        for joystick_id in SDLManager.SDL_GetJoystickIDs():
+            if not SDLManager.SDL_IsGameController(joystick_id):
+                continue  # Skip non-gamepad devices (e.g., flight sticks)
+            self.add_controller(joystick_id)
+
+    def add_controller(self, joystick_id):
+        """
+        Open a controller and record it in hardware_map / controllers.
+
+        Args:
+            joystick_id (int): SDL2 device index / SDL3 joystick ID
+        """
+        ctrl = SDLManager.SDL_GameControllerOpen(joystick_id)
+        if not ctrl:
+            return
+
+        joy = SDLManager.SDL_GameControllerGetJoystick(ctrl)
+        instance_id = SDLManager.SDL_JoystickInstanceID(joy)
+
+        if instance_id in self.controllers:
+            # Already tracked (startup scan + init-time ADDED event) — drop the extra reference
+            SDLManager.SDL_GameControllerClose(ctrl)
+            return
+
+        raw_name = SDLManager.SDL_GameControllerName(ctrl).decode()
+
+        # Get HID path (hardware-specific, persists across reconnects);
+        # None on platforms/SDL builds without one
+        path_bytes = SDLManager.SDL_GameControllerPath(ctrl)
+        hid_path = path_bytes.decode() if path_bytes else f"UNK_{instance_id}"
+
+        self.track_controller(instance_id, ctrl, hid_path, raw_name)
+
+    def track_controller(self, instance_id, ctrl, hid_path, raw_name):
+        """
+        Record an already-open controller handle as live.
+
+        Args:
+            instance_id (int): SDL2/SDL3 instance ID
+            ctrl: Open SDL_GameController / SDL_Gamepad handle
+            hid_path (str): HID path (or UNK_<id> fallback)
+            raw_name (str): SDL controller name
+        """
+        # Cache controller handle; seed kill-combo state with whatever
+        # is already held (later changes arrive as button events)
+        self.controllers[instance_id] = ctrl
+        self.kill_held[instance_id] = SDLManager.read_button_bitmask(ctrl, SDLManager.KILL_BUTTONS)
+        self.hardware_map[instance_id] = (hid_path, raw_name)
+
+    def remove_controller(self, instance_id):
+        """
+        Forget a disconnected controller and drop any assignment it held.
+
+        Args:
+            instance_id (int): SDL2/SDL3 instance ID from the removed event
+        """
+        ctrl = self.controllers.pop(instance_id, None)
+        if ctrl:
+            SDLManager.SDL_GameControllerClose(ctrl)
+        self.kill_held.pop(instance_id, None)
+        removed = self.hardware_map.pop(instance_id, None)
+        if removed is None:
+            return  # Not one of ours (e.g. closed during save_config)
+
+        # ====================================================================
+        # HOT-PLUG DISCONNECT DETECTION
+        # ====================================================================
+        # Drop the removed controller's assignment, unless the same HID path
+        # is still present under another instance ID
+        hid_path = removed[0]
+        found_index = self.assigned_paths.get(hid_path)
+        if found_index is None:
+            return  # Wasn't assigned to a player
+        if any(path == hid_path for path, _ in self.hardware_map.values()):
+            return  # Still connected
+
+        _, name = self.assignments.pop(found_index)
+        self.reindex_assignments()
+        log("INFO", "Controller disconnected", name)
+
+        # Skip the visuals while the launcher is hidden behind a running game;
+        # refresh_grid() catches the cards up when the window is shown again
+        if self.root.state() != 'withdrawn':
+            self.grid_dirty = True
+            # Show toast notification
+            self.show_toast(f"⚠️ {name} Disconnected!", self.hid_colors[hid_path])
+
+        # Recycle the controller's color
+        color = self.hid_colors.pop(hid_path, None)
+        if color:
+            self.color_pool.append(color)
+
+    def track_kill_combo(self, instance_id, button, pressed):
+        """
+        Update the held Back/L/R bitmask for one controller from a button event.
+
+        Returns:
+            bool: True when this press completes the kill combo
+        """
+        bit = 1 << button
+        if not bit & SDLManager.KILL_MASK:
+            return False  # Not a combo button
+
+        held = self.kill_held.get(instance_id, 0)
+        held = (held | bit) if pressed else (held & ~bit)
+        self.kill_held[instance_id] = held
+        return pressed and held == SDLManager.KILL_MASK
 
     # ========================================================================
     # CONTROLLER ASSIGNMENT LOGIC
@@ -1166,17 +1470,18 @@ class RyujinxLauncherApp:
         target_path, display_name = self.hardware_map[instance_id]
 
         # Prevent duplicate assignments (same controller can't be multiple players)
-        for path, _ in self.assignments:
-            if path == target_path:
-                return
+        if target_path in self.assigned_paths:
+            return
 
         # Enforce 8-player maximum
         if len(self.assignments) >= 8:
             return
 
+        self.assigned_paths[target_path] = len(self.assignments)
         self.assignments.append((target_path, display_name))
+        self.get_assigned_color(target_path)  # Claim the color now; the repaint waits for end of tick
         log("INFO", f"Assigned {display_name} → Player {len(self.assignments)}")
-        self.refresh_grid()
+        self.grid_dirty = True
 
     def remove_player(self, instance_id):
         """
@@ -1191,16 +1496,17 @@ class RyujinxLauncherApp:
         target_path, _ = self.hardware_map[instance_id]
 
         # Find and remove assignment by HID path
-        found_index = -1
-        for i, (path, _) in enumerate(self.assignments):
-            if path == target_path:
-                found_index = i
-                break
+        found_index = self.assigned_paths.get(target_path)
 
-        if found_index != -1:
+        if found_index is not None:
             self.assignments.pop(found_index)
+            self.reindex_assignments()
             log("INFO", f"Removed {target_path} from Player {found_index + 1}")
-            self.refresh_grid()
+            self.grid_dirty = True
+
+    def reindex_assignments(self):
+        """Rebuild assigned_paths after self.assignments was reordered/shrunk/reset."""
+        self.assigned_paths = {path: i for i, (path, _) in enumerate(self.assignments)}
 
     # ========================================================================
     # UI UPDATE METHODS
@@ -1211,77 +1517,71 @@ class RyujinxLauncherApp:
         If the controller hasn't been seen before, assigns a new color from the pool.
         """
         # 1. Check if we already assigned a color to this HID earlier in the session
-        if hid_path in self.hid_colors:
-            return self.hid_colors[hid_path]
+        color = self.hid_colors.get(hid_path)
+        if color is not None:
+            return color
 
         # 2. If the pool is empty (more than 20 controllers?), recycle the list
         if not self.color_pool:
-            self.color_pool = list(COLOR_POOL)
+            self.color_pool.extend(COLOR_POOL)
 
-        # 3. Assign the next available color
-        new_color = self.color_pool.pop(0)
-        self.hid_colors[hid_path] = new_color
-        return new_color
+        # 3. Assign the next available color (O(1) from the front; freed colors rejoin at the back)
+        color = self.hid_colors[hid_path] = self.color_pool.popleft()
+        return color
 
     def refresh_grid(self):
-        """Update all player slot cards to reflect current assignments."""
+        """
+        Update all player slot cards to reflect current assignments.
+        Cards whose (path, name, color) is unchanged since the last call are
+        skipped, so no-op refreshes make no Tk calls.
+        """
 
         for i in range(8):
-            card, lbl_num, lbl_status, lbl_disc = self.slot_cards[i]
-
             if i < len(self.assignments):
-                # ============================================================
-                # ACTIVE SLOT (Controller assigned)
-                # ============================================================
                 hid_path, display_name = self.assignments[i]
-
                 # --- Get the sticky pastel color ---
                 active_color = self.get_assigned_color(hid_path)
-                # ----------------------------------------
+                state = (hid_path, display_name, active_color)
+            else:
+                state = None
+
+            prev = self.slot_state[i]
+            if state == prev:
+                continue  # Card already shows this
+            self.slot_state[i] = state
+
+            if state is not None:
+                # ============================================================
+                # ACTIVE SLOT (Controller assigned)
+                # ============================================================
 
                 # Remove trailing index suffix
-                clean_name = re.sub(r'\s*\(\d+\)$', '', display_name)
+                clean_name = clean_display_name(display_name)
 
                 # Update Card Border (Use active_color)
-                card.configure(
-                    fg_color=COLOR['BG_CARD'],
-                    border_color=active_color
-                )
+                self.cards[i].configure(border_color=active_color)
 
                 # Update Player Number Color (Use active_color)
-                lbl_num.configure(fg_color="transparent", text_color=active_color)
+                self.lbl_nums[i].configure(text_color=active_color)
 
                 # Update Name Text Color (Use active_color)
-                lbl_status.place(relx=0.5, rely=0.25, anchor="center")
-                lbl_status.configure(
-                    text=clean_name,
-                    fg_color="transparent",
-                    text_color=active_color,
-                    font=(UI['FONT_FAMILY'], UI['FONT_CARD_SIZE'], "bold")
-                )
+                self.lbl_statuses[i].configure(text=clean_name, text_color=active_color)
 
-                # Show disconnect hint (Keep Red for "Danger/Action")
-                lbl_disc.place(relx=0.5, rely=0.75, anchor="center")
-                lbl_disc.configure(fg_color="transparent", text_color=COLOR['NEON_RED'])
+                # Inactive → active: move the name up and show the disconnect
+                # hint (Keep Red for "Danger/Action"); re-colors skip the layout
+                if prev is None:
+                    self.lbl_statuses[i].place(relx=0.5, rely=0.25, anchor="center")
+                    self.lbl_discs[i].place(relx=0.5, rely=0.75, anchor="center")
 
             else:
                 # ============================================================
                 # INACTIVE SLOT (No controller assigned)
                 # ============================================================
-                # (This part remains exactly the same as your original code)
-                card.configure(
-                    fg_color=COLOR['BG_CARD'],
-                    border_color=COLOR['BG_CARD']
-                )
-                lbl_num.configure(fg_color="transparent", text_color="#444444")
-                lbl_status.place(relx=0.5, rely=0.5, anchor="center")
-                lbl_status.configure(
-                    text="PRESS Ⓐ CONNECT",
-                    fg_color="transparent",
-                    text_color=COLOR['TEXT_DIM'],
-                    font=(UI['FONT_FAMILY'], UI['FONT_CARD_SIZE'], "bold")
-                )
-                lbl_disc.place_forget()
+                self.cards[i].configure(**INACTIVE_CARD_CFG)
+                self.lbl_nums[i].configure(**INACTIVE_NUM_CFG)
+                self.lbl_statuses[i].place(relx=0.5, rely=0.5, anchor="center")
+                self.lbl_statuses[i].configure(**INACTIVE_STATUS_CFG)
+                self.lbl_discs[i].place_forget()
 
     # ========================================================================
     # ALERT DIALOG SYSTEM
@@ -1297,18 +1597,16 @@ class RyujinxLauncherApp:
         """Show confirmation dialog before exiting launcher."""
         self.show_alert("EXIT")
 
-    def show_alert(self, mode):
+    def build_alert(self):
         """
-        Display a modal alert dialog.
-
-        Args:
-            mode (str): Alert type - "LAUNCH", "EXIT", or "KILL_CONFIRM"
+        Build the fullscreen alert overlay once (hidden).
+        show_alert only swaps its texts/colors; build_ui calls this on every rebuild.
         """
-        self.alert_mode = mode
+        if self.alert_frame:
+            self.alert_frame.destroy()
 
         # Fullscreen overlay
         self.alert_frame = ctk.CTkFrame(self.root, fg_color="#000000", corner_radius=0)
-        self.alert_frame.place(relx=0, rely=0, relwidth=1, relheight=1)
 
         # Dialog box
         box = ctk.CTkFrame(
@@ -1327,141 +1625,70 @@ class RyujinxLauncherApp:
             anchor="center",
         )
 
-        if mode == "LAUNCH":
-            # ================================================================
-            # NO CONTROLLERS WARNING
-            # ================================================================
-            launch_target = "GAME" if len(sys.argv) > 1 else "RYUJINX"
-
-            ctk.CTkLabel(
-                box,
-                text="⚠️ NO CONTROLLERS",
-                font=(UI['FONT_FAMILY'], UI['FONT_ALERT_TITLE_SIZE'], "bold"),
-                fg_color="transparent",
-                text_color=COLOR['ALERT_YELLOW']
-            ).pack(pady=((UI['ALERT_TITLE_PADDING_TOP']), (UI['ALERT_TITLE_PADDING_BOTTOM'])))
-
-            ctk.CTkLabel(
-                box,
-                text="Ryujinx will launch with default inputs.",
-                font=(UI['FONT_FAMILY'], UI['FONT_ALERT_TEXT_SIZE']),
-                fg_color="transparent",
-                text_color=COLOR['ALERT_TEXT_DIM']
-            ).pack(pady=(UI['ALERT_TEXT_PADDING']))
-
-            btn_frame = ctk.CTkFrame(box, fg_color=COLOR['ALERT_BOX_BG'], corner_radius=0)
-            btn_frame.pack(pady=(UI['ALERT_BTN_PADDING_TOP']))
-
-            ctk.CTkLabel(
-                btn_frame,
-                text=f"Ⓐ LAUNCH {launch_target}",
-                font=(UI['FONT_FAMILY'], UI['FONT_ALERT_BTN_SIZE'], "bold"),
-                fg_color="transparent",
-                text_color=COLOR['NEON_BLUE']
-            ).pack(side="left", padx=(UI['ALERT_BTN_PADDING_X']))
-
-            ctk.CTkLabel(
-                btn_frame,
-                text="Ⓑ BACK",
-                font=(UI['FONT_FAMILY'], UI['FONT_ALERT_BTN_SIZE'], "bold"),
-                fg_color="transparent",
-                text_color=COLOR['NEON_RED']
-            ).pack(side="left", padx=(UI['ALERT_BTN_PADDING_X']))
-
-        elif mode == "EXIT":
-            # ================================================================
-            # EXIT CONFIRMATION
-            # ================================================================
-            ctk.CTkLabel(
-                box,
-                text="EXIT LAUNCHER?",
-                font=(UI['FONT_FAMILY'], UI['FONT_ALERT_TITLE_SIZE'], "bold"),
-                fg_color="transparent",
-                text_color=COLOR['TEXT_WHITE']
-            ).pack(pady=((UI['ALERT_TITLE_PADDING_TOP']), (UI['ALERT_TITLE_PADDING_BOTTOM'])))
-
-            ctk.CTkLabel(
-                box,
-                text="Are you sure you want to quit?",
-                font=(UI['FONT_FAMILY'], UI['FONT_ALERT_TEXT_SIZE']),
-                fg_color="transparent",
-                text_color=COLOR['ALERT_TEXT_DIM']
-            ).pack(pady=(UI['ALERT_TEXT_PADDING']))
+        self.alert_title = ctk.CTkLabel(
+            box,
+            text="",
+            font=FONT['ALERT_TITLE'],
+            fg_color="transparent"
+        )
+        self.alert_title.pack(pady=((UI['ALERT_TITLE_PADDING_TOP']), (UI['ALERT_TITLE_PADDING_BOTTOM'])))
 
-            btn_frame = ctk.CTkFrame(box, fg_color=COLOR['ALERT_BOX_BG'], corner_radius=0)
-            btn_frame.pack(pady=(UI['ALERT_BTN_PADDING_TOP']))
+        self.alert_text = ctk.CTkLabel(
+            box,
+            text="",
+            font=FONT['ALERT_TEXT'],
+            fg_color="transparent",
+            text_color=COLOR['ALERT_TEXT_DIM']
+        )
+        self.alert_text.pack(pady=(UI['ALERT_TEXT_PADDING']))
 
-            ctk.CTkLabel(
-                btn_frame,
-                text="Ⓐ YES",
-                font=(UI['FONT_FAMILY'], UI['FONT_ALERT_BTN_SIZE'], "bold"),
-                fg_color="transparent",
-                text_color=COLOR['NEON_BLUE']
-            ).pack(side="left", padx=(UI['ALERT_BTN_PADDING_X']))
+        btn_frame = ctk.CTkFrame(box, fg_color=COLOR['ALERT_BOX_BG'], corner_radius=0)
+        btn_frame.pack(pady=(UI['ALERT_BTN_PADDING_TOP']))
 
+        # Up to three button hints (KILL_CONFIRM uses all three)
+        self.alert_buttons = [
             ctk.CTkLabel(
                 btn_frame,
-                text="Ⓑ NO",
-                font=(UI['FONT_FAMILY'], UI['FONT_ALERT_BTN_SIZE'], "bold"),
-                fg_color="transparent",
-                text_color=COLOR['NEON_RED']
-            ).pack(side="left", padx=(UI['ALERT_BTN_PADDING_X']))
+                text="",
+                font=FONT['ALERT_BTN'],
+                fg_color="transparent"
+            )
+            for _ in range(3)
+        ]
+        self.alert_layout = None  # Mode the widgets are currently filled in for
 
-        elif mode == "KILL_CONFIRM":
-            # ================================================================
-            # KILL GAME MENU (THREE OPTIONS)
-            # ================================================================
-            ctk.CTkLabel(
-                box,
-                text="KILL GAME?",
-                font=(UI['FONT_FAMILY'], UI['FONT_ALERT_TITLE_SIZE'], "bold"),
-                fg_color="transparent",
-                text_color=COLOR['TEXT_WHITE']
-            ).pack(pady=((UI['ALERT_TITLE_PADDING_TOP']), (UI['ALERT_TITLE_PADDING_BOTTOM'])))
+    def show_alert(self, mode):
+        """
+        Display a modal alert dialog.
 
-            ctk.CTkLabel(
-                box,
-                text="How would you like to proceed?",
-                font=(UI['FONT_FAMILY'], UI['FONT_ALERT_TEXT_SIZE']),
-                fg_color="transparent",
-                text_color=COLOR['ALERT_TEXT_DIM']
-            ).pack(pady=(UI['ALERT_TEXT_PADDING']))
+        Args:
+            mode (str): Alert type - "LAUNCH", "EXIT", or "KILL_CONFIRM"
+        """
+        self.alert_mode = mode
 
-            btn_frame = ctk.CTkFrame(box, fg_color=COLOR['ALERT_BOX_BG'], corner_radius=0)
-            btn_frame.pack(pady=(UI['ALERT_BTN_PADDING_TOP']))
+        # Re-fill the scaffold only when switching dialogs (e.g. reopening
+        # the kill menu after a cancel just places it again)
+        if mode != self.alert_layout:
+            self.alert_layout = mode
+            title, title_color, text, buttons = self.alert_specs[mode]
 
-            # Option 1: Return to launcher for controller reconfiguration
-            ctk.CTkLabel(
-                btn_frame,
-                text="Ⓐ LAUNCHER",
-                font=(UI['FONT_FAMILY'], UI['FONT_ALERT_BTN_SIZE'], "bold"),
-                fg_color="transparent",
-                text_color=COLOR['NEON_BLUE']
-            ).pack(side="left", padx=(UI['ALERT_BTN_PADDING_X']))
+            self.alert_title.configure(text=title, text_color=title_color)
+            self.alert_text.configure(text=text)
 
-            # Option 2: Exit to desktop
-            ctk.CTkLabel(
-                btn_frame,
-                text="Ⓨ DESKTOP",
-                font=(UI['FONT_FAMILY'], UI['FONT_ALERT_BTN_SIZE'], "bold"),
-                fg_color="transparent",
-                text_color=COLOR['ALERT_YELLOW']
-            ).pack(side="left", padx=(UI['ALERT_BTN_PADDING_X']))
+            padx = UI['ALERT_BTN_PADDING_X']
+            for label in self.alert_buttons:
+                label.pack_forget()
+            for label, (btn_text, btn_color) in zip(self.alert_buttons, buttons):
+                label.configure(text=btn_text, text_color=btn_color)
+                label.pack(side="left", padx=padx)
 
-            # Option 3: Cancel and resume game
-            ctk.CTkLabel(
-                btn_frame,
-                text="Ⓑ CANCEL",
-                font=(UI['FONT_FAMILY'], UI['FONT_ALERT_BTN_SIZE'], "bold"),
-                fg_color="transparent",
-                text_color=COLOR['NEON_RED']
-            ).pack(side="left", padx=(UI['ALERT_BTN_PADDING_X']))
+        self.alert_frame.place(relx=0, rely=0, relwidth=1, relheight=1)
+        self.alert_frame.lift()
 
     def close_alert(self):
         self.alert_mode = None
         if self.alert_frame:
-            self.alert_frame.destroy()
-            self.alert_frame = None
+            self.alert_frame.place_forget()
 
     # ========================================================================
     # CONFIG GENERATION & LAUNCH
@@ -1476,10 +1703,10 @@ class RyujinxLauncherApp:
         # ====================================================================
         # STEP 1: RESET SDL SUBSYSTEM
         # ====================================================================
-        # Close all existing controller handles
-        for c in self.controllers.values():
-            SDLManager.SDL_GameControllerClose(c)
+        # Drop our handles — quitting the subsystem closes every open
+        # controller itself, so no per-handle Close calls are needed
         self.controllers.clear()
+        self.kill_held.clear()
 
         # Reinitialize SDL2/SDL3 for fresh enumeration
         SDLManager.SDL_QuitSubSystem(SDLManager.SDL_INIT_JOYSTICK | SDLManager.SDL_INIT_GAMECONTROLLER)
@@ -1488,92 +1715,110 @@ class RyujinxLauncherApp:
         # ====================================================================
         # STEP 2: BUILD HARDWARE LIST WITH CORRECT GUID INDICES
         # ====================================================================
-        final_hw_list = []
-        guid_counters = {}  # Track index per unique GUID
+        hw_by_path = {}  # {HID path: hardware entry} - first controller per path wins
+        guid_counters = defaultdict(int)  # Track index per unique GUID
+
+        psz_guid = (ctypes.c_char * 33)()  # GUID string buffer, reused for every controller
+
+        # Per-controller SDL calls as locals (LOAD_FAST instead of class lookups)
+        is_controller   = SDLManager.SDL_IsGameController
+        open_controller = SDLManager.SDL_GameControllerOpen
+        get_joystick    = SDLManager.SDL_GameControllerGetJoystick
+        get_instance_id = SDLManager.SDL_JoystickInstanceID
+        get_guid        = SDLManager.SDL_JoystickGetGUID
+        get_guid_string = SDLManager.SDL_JoystickGetGUIDString
+        get_path        = SDLManager.SDL_GameControllerPath
+        get_name        = SDLManager.SDL_GameControllerName
+
+        # Re-init hands out new instance IDs — the handles opened below
+        # become the live controller map
+        self.hardware_map.clear()
 
         for joystick_id in SDLManager.SDL_GetJoystickIDs():
-            if not SDLManager.SDL_IsGameController(joystick_id):
+            if not is_controller(joystick_id):
                 continue
 
-            ctrl = SDLManager.SDL_GameControllerOpen(joystick_id)
+            ctrl = open_controller(joystick_id)
             if ctrl:
-                joy = SDLManager.SDL_GameControllerGetJoystick(ctrl)
+                joy = get_joystick(ctrl)
+                instance_id = get_instance_id(joy)
 
                 # Extract GUID
-                guid_obj = SDLManager.SDL_JoystickGetGUID(joy)
-                psz_guid = (ctypes.c_char * 33)()
-                SDLManager.SDL_JoystickGetGUIDString(guid_obj, psz_guid, 33)
+                guid_obj = get_guid(joy)
+                get_guid_string(guid_obj, psz_guid, 33)
                 raw_guid_str = psz_guid.value.decode()
                 base_guid = self.ryujinx_guid_fix(raw_guid_str)
 
                 # Extract HID path (for matching with assignments)
-                try:
-                    p = SDLManager.SDL_GameControllerPath(ctrl)
-                    path = p.decode() if p else ""
-                except:
-                    path = ""
+                p = get_path(ctrl)
+                path = p.decode() if p else ""
 
                 # Calculate index (e.g., "0-GUID", "1-GUID" for duplicate GUIDs)
-                idx = guid_counters.get(base_guid, 0)
+                idx = guid_counters[base_guid]
+                guid_counters[base_guid] += 1
                 final_id = f"{idx}-{base_guid}"
-                guid_counters[base_guid] = idx + 1
 
-                final_hw_list.append({
-                    "path": path,
+                name = get_name(ctrl).decode()
+                hw_by_path.setdefault(path, {
                     "ryu_id": final_id,
-                    "name": SDLManager.SDL_GameControllerName(ctrl).decode()
+                    "name": name
                 })
 
-                SDLManager.SDL_GameControllerClose(ctrl)
+                # Keep the handle open for update_loop instead of closing it
+                # and re-opening everything with a second scan
+                self.track_controller(instance_id, ctrl, path or f"UNK_{instance_id}", name)
 
         # ====================================================================
         # STEP 3: MATCH ASSIGNMENTS TO HARDWARE BY HID PATH
         # ====================================================================
-        if not os.path.exists(CONFIG_FILE):
-            return  # No config file to modify
+        # Player N keeps its slot number even if an earlier slot's controller vanished
+        new_input = [
+            self.make_input_entry(i, hw_by_path[assigned_path])
+            for i, (assigned_path, _) in enumerate(self.assignments)
+            if assigned_path in hw_by_path
+        ]
 
+        # ====================================================================
+        # STEP 4: REWRITE CONFIG.JSON (ONE HANDLE FOR READ + WRITE)
+        # ====================================================================
         try:
-            with open(CONFIG_FILE, 'r') as f:
-                data = json.load(f)
-        except:
-            return  # Corrupted config
-
-        new_input = []
+            f = open(CONFIG_FILE, 'r+b')
+        except OSError:
+            return  # No config file to modify
 
-        for i, (assigned_path, _) in enumerate(self.assignments):
-            # Find hardware entry matching this assignment's HID path
-            matched_hw = next(
-                (x for x in final_hw_list if x["path"] == assigned_path),
-                None
-            )
+        with f:
+            try:
+                data = json_loads(f.read())
+            except:
+                return  # Corrupted config
 
-            if matched_hw:
-                # Create controller config entry
-                entry = copy.deepcopy(self.master_template)
-                entry["id"] = matched_hw["ryu_id"]      # Correct GUID with index
-                if ryujinx_version == "1.1.1403":
-                    # Ryujinx (v1.1.1403)
-                    entry.pop("led", None)
-                    entry.pop("name", None)
-                elif ryujinx_version == "1.3.1":
-                    # Ryujinx (v1.3.1)
-                    entry.pop("name", None)
-                else:
-                    # Ryujinx (v1.3.2/v1.3.3/All New version)
-                    entry["name"] = matched_hw["name"]
+            # Write updated config (serialize first, so a failure leaves the file intact)
+            data["input_config"] = new_input
+            try:
+                payload = json_dumps(data)
+                f.seek(0)
+                f.write(payload)
+                f.truncate()
+            except:
+                pass  # Write failed, Ryujinx will use old config
+
+    def make_input_entry(self, slot, matched_hw):
+        """
+        Build one Ryujinx input_config entry from the master template.
 
-                entry["player_index"] = f"Player{i+1}"
-                entry["backend"] = backend_string
-                entry["controller_type"] = "ProController"
-                new_input.append(entry)
+        Args:
+            slot (int): Zero-based player slot
+            matched_hw (dict): save_config hardware entry ("ryu_id", "name")
+        """
+        entry = clone_template(self.master_template)
+        entry["id"] = matched_hw["ryu_id"]      # Correct GUID with index
+        if _ENTRY_HAS_NAME:
+            entry["name"] = matched_hw["name"]  # Unsupported keys already stripped from the template
 
-        # Write updated config
-        data["input_config"] = new_input
-        try:
-            with open(CONFIG_FILE, 'w', encoding='utf-8') as f:
-                json.dump(data, f, indent=2, ensure_ascii=False)
-        except:
-            pass  # Write failed, Ryujinx will use old config
+        entry["player_index"] = f"Player{slot+1}"
+        entry["backend"] = backend_string
+        entry["controller_type"] = "ProController"
+        return entry
 
     def force_launch(self):
         """
@@ -1590,26 +1835,28 @@ class RyujinxLauncherApp:
             try:
                 # Launch Ryujinx with all arguments passed to launcher
                 cmd_args = [TARGET_EXE] + sys.argv[1:]
-                self.ryujinx_process = subprocess.Popen(cmd_args, env=ryujinx_env)
+                self.ryujinx_process = subprocess.Popen(cmd_args)
+                self.root.after(PROCESS_POLL_MS, self.watch_ryujinx, self.ryujinx_process)
             except Exception as e:
                 log("EXCEPTION", "Launch failed", e)
                 messagebox.showerror(
                     "Launch Error",
                     f"Failed to start Ryujinx.\n{e}"
                 )
-                sys.exit()
+                self.shutdown()
         else:
             log("ERROR", "TARGET_EXE not found", TARGET_EXE)
             messagebox.showerror(
                 "Missing File",
                 f"Could not find {TARGET_EXE}"
             )
-            sys.exit()
+            self.shutdown()
 
 # ============================================================================
 # ENTRY POINT
 # ============================================================================
 if __name__ == "__main__":
+    SDLManager = load_sdl_backend()
     root = ctk.CTk()
     app = RyujinxLauncherApp(root)
     root.mainloop()
\ No newline at end of file